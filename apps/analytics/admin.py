@@ -1,3 +1,14 @@
 from django.contrib import admin
+from unfold.admin import ModelAdmin
 
-# Register your models here.
+from apps.analytics.models import PostViewDaily
+
+
+@admin.register(PostViewDaily)
+class PostViewDailyAdmin(ModelAdmin):
+    list_display = ("post", "date", "views", "unique_views", "updated_at")
+    list_filter = ("date",)
+    search_fields = ("post__title", "post__slug")
+    raw_id_fields = ("post",)
+    date_hierarchy = "date"
+    ordering = ("-date", "-views")
@@ -0,0 +1,59 @@
+# Generated by Django 5.2.9 on 2026-10-17 03:11
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("posts", "0012_add_trgm_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PostViewDaily",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField()),
+                ("views", models.PositiveBigIntegerField(default=0)),
+                ("unique_views", models.PositiveIntegerField(blank=True, null=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "post",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_views",
+                        to="posts.post",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Post Daily Views",
+                "verbose_name_plural": "Post Daily Views",
+                "db_table": "Post_views_daily",
+                "indexes": [
+                    models.Index(
+                        fields=["date", "post"],
+                        include=("views",),
+                        name="post_views_daily_date",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("post", "date"), name="post_views_daily_post_date"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,65 @@
+from django.db import connection, models
+from django.utils import timezone
+
+from apps.posts.models import Post
+
+
+class PostViewDailyManager(models.Manager):
+    def add_views(self, rows):
+        """
+        Upsert (post_id, date, views, unique_views) rows in one statement, adding
+        `views` to the stored count. `unique_views` replaces the stored value when given,
+        since per-day uniques can't be summed.
+        """
+        rows = list(rows)
+        if not rows:
+            return
+
+        qn = connection.ops.quote_name
+        table = qn(self.model._meta.db_table)
+        now = timezone.now()
+        placeholders = ", ".join(["(%s, %s, %s, %s, %s)"] * len(rows))
+        params = []
+        for post_id, date, views, unique_views in rows:
+            params.extend([post_id, date, views, unique_views, now])
+
+        sql = (
+            f"INSERT INTO {table} ({qn('post_id')}, {qn('date')}, {qn('views')},"
+            f" {qn('unique_views')}, {qn('updated_at')}) VALUES {placeholders}"
+            f" ON CONFLICT ({qn('post_id')}, {qn('date')}) DO UPDATE SET"
+            f" {qn('views')} = {table}.{qn('views')} + EXCLUDED.{qn('views')},"
+            f" {qn('unique_views')} = COALESCE(EXCLUDED.{qn('unique_views')},"
+            f" {table}.{qn('unique_views')}),"
+            f" {qn('updated_at')} = EXCLUDED.{qn('updated_at')}"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+
+
+class PostViewDaily(models.Model):
+    """
+    Per-post, per-day view counts flushed from the Redis counters.
+    """
+
+    post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name="daily_views")
+    date = models.DateField()
+    views = models.PositiveBigIntegerField(default=0)
+    unique_views = models.PositiveIntegerField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = PostViewDailyManager()
+
+    def __str__(self):
+        return f"{self.post_id} @ {self.date}: {self.views}"
+
+    class Meta:
+        db_table = "Post_views_daily"
+        verbose_name = "Post Daily Views"
+        verbose_name_plural = "Post Daily Views"
+        constraints = [
+            models.UniqueConstraint(fields=["post", "date"], name="post_views_daily_post_date"),
+        ]
+        indexes = [
+            # windowed aggregates (SUM(views) ... WHERE date >= ... GROUP BY post)
+            models.Index(fields=["date", "post"], include=["views"], name="post_views_daily_date"),
+        ]
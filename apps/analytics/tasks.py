@@ -0,0 +1,49 @@
+import logging
+
+from celery import shared_task
+from django.core.cache import cache
+
+from apps.analytics.models import PostViewDaily
+from apps.posts.models import Post
+from apps.posts.services.post_views import pop_view_deltas, restore_view_deltas
+
+logger = logging.getLogger(__name__)
+
+FLUSH_BATCH_SIZE = 500
+FLUSH_MAX_BATCHES = 200  # leave the rest for the next run instead of hogging a worker
+FLUSH_LOCK_TIMEOUT = 60 * 5
+
+
+@shared_task
+def flush_post_view_counters():
+    """
+    Drain per-day view deltas from Redis into PostViewDaily.
+    Deltas are handed back to Redis if the database write fails, so no views are lost.
+    """
+    if not cache.add("lock:flush_post_view_counters", 1, FLUSH_LOCK_TIMEOUT):
+        return "Flush already running."
+
+    flushed = 0
+    try:
+        for _ in range(FLUSH_MAX_BATCHES):
+            deltas = pop_view_deltas(FLUSH_BATCH_SIZE)
+            if not deltas:
+                break
+
+            post_ids = {post_id for post_id, *_ in deltas}
+            existing = set(Post.objects.filter(pk__in=post_ids).values_list("pk", flat=True))
+            # views of deleted posts are dropped
+            rows = [delta for delta in deltas if delta[0] in existing]
+            try:
+                PostViewDaily.objects.add_views(rows)
+            except Exception as e:
+                restore_view_deltas(deltas)
+                logger.error("[ANALYTICS] Failed to flush post view counters: %s", str(e))
+                raise
+            flushed += len(rows)
+    finally:
+        cache.delete("lock:flush_post_view_counters")
+
+    if flushed:
+        logger.info("[ANALYTICS] Flushed post view counters - count=%s", flushed)
+    return f"Flushed {flushed} counters."
@@ -1,16 +1,17 @@
 from rest_framework import serializers
 
 from apps.bookmarks.models import Bookmark
-from apps.posts.serializers import PostListSerializer
+from apps.posts.serializers import PostCardSerializer
 
 
 class BookmarkSerializer(serializers.ModelSerializer):
-    post = PostListSerializer(read_only=True)
+    # renders .values() rows carrying the post card columns under "post__"
+    user = serializers.IntegerField(read_only=True)
+    post = PostCardSerializer(source="*", prefix="post__", read_only=True)
 
     class Meta:
         model = Bookmark
         fields = ["id", "user", "post", "created_at", "updated_at"]
         extra_kwargs = {
             "id": {"read_only": True},
-            "user": {"read_only": True},
         }
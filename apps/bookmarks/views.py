@@ -5,6 +5,7 @@ from rest_framework.viewsets import GenericViewSet
 
 from apps.bookmarks.models import Bookmark
 from apps.posts.models import Post
+from apps.posts.services.post_cards import post_card_fields
 
 from .serializers import BookmarkSerializer
 
@@ -18,8 +19,7 @@ class BookmarkViewSet(mixins.ListModelMixin, GenericViewSet):
         # TODO with post statuses
         qs = (
             Bookmark.objects.filter(user=self.request.user, post__status=Post.Status.PUBLISHED)
-            .select_related("user", "post")
-            .prefetch_related("post__images")
             .order_by("-created_at")
+            .values("id", "user", "created_at", "updated_at", *post_card_fields("post__"))
         )
         return qs
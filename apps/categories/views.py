@@ -1,4 +1,5 @@
 import logging
+from functools import partial
 
 from drf_spectacular.utils import extend_schema
 from rest_framework.decorators import action
@@ -10,7 +11,14 @@ from apps.categories.models import Category
 from apps.categories.serializers import CategorySerializer
 from apps.common.pagination import PostPageNumberPagination
 from apps.common.permissions.base import IsAdmin
-from apps.posts.serializers import PostListSerializer
+from apps.common.utils.conditional import (
+    conditional_response,
+    instance_validators,
+    queryset_validators,
+)
+from apps.posts.models import Post
+from apps.posts.serializers import PostCardSerializer
+from apps.posts.services.post_cards import post_card_values
 
 logger = logging.getLogger(__name__)
 
@@ -26,9 +34,24 @@ class CategoryViewSet(ModelViewSet):
 
     def get_serializer_class(self):
         if self.action == "posts":
-            return PostListSerializer
+            return PostCardSerializer
         return CategorySerializer
 
+    def list(self, request, *args, **kwargs):
+        etag, last_modified = queryset_validators(self.get_queryset(), request.accepted_media_type)
+        build = partial(super().list, request, *args, **kwargs)
+        return conditional_response(request, build, etag, last_modified)
+
+    def retrieve(self, request, *args, **kwargs):
+        category: Category = self.get_object()
+        etag, last_modified = instance_validators(category, request.accepted_media_type)
+        return conditional_response(
+            request,
+            lambda: Response(self.get_serializer(category).data),
+            etag,
+            last_modified,
+        )
+
     def perform_create(self, serializer):
         instance = serializer.save()
         logger.info(
@@ -52,11 +75,19 @@ class CategoryViewSet(ModelViewSet):
     @action(methods=["get"], detail=True, url_path="posts")
     def posts(self, request, pk=None):
         category: Category = self.get_object()
-        qs = category.posts.all().select_related("author", "category").prefetch_related("images")
-        paginator = PostPageNumberPagination()
-        page = paginator.paginate_queryset(qs, request)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return paginator.get_paginated_response(serializer.data)
-        serializer = self.get_serializer(qs, many=True)
-        return Response(serializer.data)
+        qs = category.posts.all()
+
+        def build():
+            paginator = PostPageNumberPagination()
+            page = paginator.paginate_queryset(post_card_values(qs), request)
+            if page is not None:
+                serializer = self.get_serializer(page, many=True)
+                return paginator.get_paginated_response(serializer.data)
+            serializer = self.get_serializer(post_card_values(qs), many=True)
+            return Response(serializer.data)
+
+        # post cards carry no category fields: only the posts and their counters matter
+        etag, last_modified = queryset_validators(
+            qs, request.accepted_media_type, counter_fields=Post.ENGAGEMENT_COUNTER_FIELDS
+        )
+        return conditional_response(request, build, etag, last_modified)
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.9 on 2026-10-17 03:30
+
+import django.contrib.postgres.operations
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # built concurrently so writes to Comments are not blocked meanwhile
+    atomic = False
+
+    dependencies = [
+        ("comments", "0002_commentreaction"),
+    ]
+
+    operations = [
+        django.contrib.postgres.operations.AddIndexConcurrently(
+            model_name="comment",
+            index=models.Index(fields=["post", "-created_at"], name="comment_post_created_idx"),
+        ),
+    ]
@@ -2,6 +2,7 @@ from django.db import models, transaction
 
 from apps.common.models import BaseModel
 from apps.posts.models import Post
+from apps.posts.services.counters import adjust_counter
 from apps.users.models import User
 
 from .comment_manager import CommentsManager
@@ -32,14 +33,20 @@ class Comment(BaseModel):
         db_table = "Comments"
         verbose_name = "Comment"
         verbose_name_plural = "Comments"
+        indexes = [
+            # newest-first comment feed of a post, paged by (created_at, id)
+            models.Index(fields=["post", "-created_at"], name="comment_post_created_idx"),
+        ]
 
     def delete(self, using=None, keep_parents=False):
         self.soft_delete()
 
     def soft_delete(self):
         with transaction.atomic():
-            self.is_deleted = True
-            self.save(update_fields=["is_deleted"])
+            if not self.is_deleted:
+                self.is_deleted = True
+                self.save(update_fields=["is_deleted"])
+                adjust_counter(self.post_id, "comments_count", -1)
 
         for child in self.replies.all():
             child.soft_delete()
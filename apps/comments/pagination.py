@@ -1,7 +1,13 @@
 from rest_framework.pagination import PageNumberPagination
 
+from apps.common.pagination import EstimatedCountPaginationMixin, KeysetPaginationMixin
 
-class CommentPageNumberPagination(PageNumberPagination):
+
+class CommentPageNumberPagination(EstimatedCountPaginationMixin, PageNumberPagination):
     page_size = 10
     page_size_query_param = "page_size"
     max_page_size = 50
+
+
+class CommentFeedPagination(KeysetPaginationMixin, CommentPageNumberPagination):
+    keyset_field = "created_at"
@@ -13,7 +13,7 @@ from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 
 from apps.comments.models import Comment, CommentEditHistory, CommentReaction
-from apps.comments.pagination import CommentPageNumberPagination
+from apps.comments.pagination import CommentFeedPagination
 from apps.comments.serializers import CommentCreateSerializer, CommentReadSerializer
 from apps.posts.models import Post
 
@@ -23,7 +23,7 @@ logger = logging.getLogger(__name__)
 @extend_schema(tags=["Posts"])
 class CommentViewSet(ModelViewSet):
     permission_classes = [IsAuthenticatedOrReadOnly]
-    pagination_class = CommentPageNumberPagination
+    pagination_class = CommentFeedPagination
     filter_backends = [OrderingFilter]
     ordering = ["-created_at"]
     ordering_fields = ["likes", "dislikes", "created_at", "-created_at"]
@@ -138,7 +138,11 @@ class CommentViewSet(ModelViewSet):
     def list(self, request, *args, **kwargs):
         response = super().list(request, *args, **kwargs)
         post_slug = self.kwargs.get("post_slug")
-        response.data["total_comments"] = Comment.objects.filter(post__slug=post_slug).count()
+        # denormalized counter of the post's live comments, replies included
+        response.data["total_comments"] = (
+            Post.objects.filter(slug=post_slug).values_list("comments_count", flat=True).first()
+            or 0
+        )
         return response
 
     def perform_create(self, serializer):
@@ -1,7 +1,252 @@
+import base64
+import binascii
+import json
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger
+from django.core.paginator import Paginator as DjangoPaginator
+from django.db.models import F, Q
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from apps.common.utils.counts import planner_estimate
+
+COUNT_ESTIMATE_THRESHOLD = 10_000  # planner estimates at or above this replace COUNT(*)
+
+
+def encode_cursor(value, pk) -> str:
+    """
+    Opaque token for the keyset position (value, pk); `value` is a datetime or None.
+    """
+    raw = json.dumps([value.isoformat() if value is not None else None, pk])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str, field):
+    """
+    (value, pk) of a token from encode_cursor, with the value parsed by model `field`.
+    Raises ValueError for anything that is not such a token.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        value, pk = json.loads(raw)
+        if value is not None:
+            value = field.to_python(value)
+        return value, int(pk)
+    except (binascii.Error, ValueError, TypeError, DjangoValidationError) as e:
+        raise ValueError(f"Invalid cursor: {token!r}") from e
+
+
+def seek_after(field: str, value, pk) -> Q:
+    """
+    Rows strictly after (value, pk) in "field DESC NULLS FIRST, pk DESC" order.
+    """
+    if value is None:
+        return Q(**{f"{field}__isnull": True, "pk__lt": pk}) | Q(**{f"{field}__isnull": False})
+    return Q(**{f"{field}__lte": value}) & (Q(**{f"{field}__lt": value}) | Q(pk__lt=pk))
+
+
+class EstimatedCountPage(Page):
+    def __init__(self, object_list, number, paginator, has_next):
+        super().__init__(object_list, number, paginator)
+        self._has_next = has_next
+
+    def has_next(self):
+        return self._has_next
+
+
+class EstimatedCountPaginator(DjangoPaginator):
+    """
+    Paginator that takes the planner's row estimate as its count once it reaches
+    COUNT_ESTIMATE_THRESHOLD: counting such results exactly is what makes large
+    listings slow, and page links do not need the exact figure. Smaller results are
+    counted exactly.
+
+    With an estimated count, pages past the estimated end are still served while they
+    have rows, and a page that reaches the real end replaces the estimate with the exact
+    count, which it then knows for free.
+    """
+
+    estimate_threshold = COUNT_ESTIMATE_THRESHOLD
+    count_is_estimate = False
+
+    @cached_property
+    def count(self):
+        estimate = planner_estimate(self.object_list)
+        if estimate is not None and estimate >= self.estimate_threshold:
+            self.count_is_estimate = True
+            return estimate
+        return super().count
+
+    def validate_number(self, number):
+        if not (self.count and self.count_is_estimate):
+            return super().validate_number(number)
+        # the estimate may fall short of the real end, page() looks for rows instead
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(self.error_messages["invalid_page"])
+        if number < 1:
+            raise EmptyPage(self.error_messages["min_page"])
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        if not self.count_is_estimate:
+            return super().page(number)
+
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom : bottom + self.per_page + 1])
+        if not rows and number > 1:
+            raise EmptyPage(self.error_messages["no_results"])
+        has_next = len(rows) > self.per_page
+        if not has_next:
+            self.count = bottom + len(rows)
+            self.count_is_estimate = False
+        return EstimatedCountPage(rows[: self.per_page], number, self, has_next)
+
 
+class EstimatedCountPaginationMixin:
+    """
+    Page number pagination counted by EstimatedCountPaginator. Responses tell clients
+    whether `count` is exact through `count_is_estimate`.
+    """
 
-class PostPageNumberPagination(PageNumberPagination):
+    django_paginator_class = EstimatedCountPaginator
+
+    def get_paginated_response(self, data):
+        paginator = self.page.paginator
+        return Response(
+            {
+                "count": paginator.count,
+                "count_is_estimate": paginator.count_is_estimate,
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema["properties"] = {
+            "count": response_schema["properties"]["count"],
+            "count_is_estimate": {"type": "boolean", "example": False},
+            **response_schema["properties"],
+        }
+        return response_schema
+
+
+class KeysetPaginationMixin:
+    """
+    Opt-in keyset (cursor) mode for a PageNumberPagination.
+
+    `?pagination=cursor` returns the newest page plus an opaque `next` link carrying the
+    (keyset_field, id) of its last row. The following page is read with
+    `WHERE (keyset_field, id) < cursor ORDER BY keyset_field DESC, id DESC LIMIT n + 1`,
+    so every page costs one index range scan: no COUNT, no OFFSET, and rows inserted
+    meanwhile never shift a page. Cursor mode only walks forward, in the fixed
+    newest-first order, so it rejects the params that would reorder the feed.
+    """
+
+    keyset_field = "created_at"
+    keyset_mode_query_param = "pagination"
+    keyset_mode = "cursor"
+    cursor_query_param = "cursor"
+    keyset_conflicting_params = ("ordering",)
+    invalid_cursor_message = "Invalid cursor."
+
+    keyset = False
+
+    def keyset_requested(self, query_params) -> bool:
+        return query_params.get(self.keyset_mode_query_param) == self.keyset_mode or bool(
+            query_params.get(self.cursor_query_param)
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = self.keyset_requested(request.query_params)
+        if not self.keyset:
+            return super().paginate_queryset(queryset, request, view)
+
+        conflicting = [p for p in self.keyset_conflicting_params if request.query_params.get(p)]
+        if conflicting:
+            raise ValidationError(
+                {
+                    self.cursor_query_param: (
+                        f"Cursor pagination can not be combined with: {', '.join(conflicting)}."
+                    )
+                }
+            )
+
+        self.request = request
+        page_size = self.get_page_size(request)
+        queryset = queryset.order_by(F(self.keyset_field).desc(nulls_first=True), "-pk")
+
+        token = request.query_params.get(self.cursor_query_param)
+        if token:
+            try:
+                value, pk = decode_cursor(token, queryset.model._meta.get_field(self.keyset_field))
+            except ValueError:
+                raise NotFound(self.invalid_cursor_message) from None
+            queryset = queryset.filter(seek_after(self.keyset_field, value, pk))
+
+        rows = list(queryset[: page_size + 1])
+        self.page = rows[:page_size]
+        self.next_position = None
+        if len(rows) > page_size:
+            self.next_position = self._position(self.page[-1])
+        return self.page
+
+    def _position(self, row):
+        if isinstance(row, dict):  # .values() rows
+            return row[self.keyset_field], row["id"]
+        return getattr(row, self.keyset_field), row.pk
+
+    def get_next_cursor_link(self):
+        if self.next_position is None:
+            return None
+        url = remove_query_param(self.request.build_absolute_uri(), self.page_query_param)
+        return replace_query_param(url, self.cursor_query_param, encode_cursor(*self.next_position))
+
+    def get_paginated_response(self, data):
+        if not self.keyset:
+            return super().get_paginated_response(data)
+        return Response({"next": self.get_next_cursor_link(), "results": data})
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            *super().get_schema_operation_parameters(view),
+            {
+                "name": self.keyset_mode_query_param,
+                "required": False,
+                "in": "query",
+                "description": (
+                    f"'{self.keyset_mode}' switches to keyset pagination: newest first, "
+                    "follow `next`, no total count."
+                ),
+                "schema": {"type": "string", "enum": [self.keyset_mode]},
+            },
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Opaque position taken from the `next` link of the previous page.",
+                "schema": {"type": "string"},
+            },
+        ]
+
+
+class PostPageNumberPagination(EstimatedCountPaginationMixin, PageNumberPagination):
     page_size = 50
     page_size_query_param = "page_size"
     max_page_size = 200
+
+
+class PostFeedPagination(KeysetPaginationMixin, PostPageNumberPagination):
+    # (status, published_at) index; search hits come in rank order, not feed order
+    keyset_field = "published_at"
+    keyset_conflicting_params = ("ordering", "q")
@@ -0,0 +1,175 @@
+import logging
+import math
+import random
+import time
+
+from django.core.cache import cache, caches
+
+logger = logging.getLogger(__name__)
+
+LOCK_TIMEOUT = 10  # seconds; the recompute lease expires on its own if a worker dies
+WAIT_TIMEOUT = 2.0  # how long readers wait for another worker's recompute
+POLL_INTERVAL = 0.05
+EARLY_REFRESH_BETA = 1.0  # XFetch aggressiveness, 0 disables early refresh
+REFRESH_MARKER_TIMEOUT = 60  # dedupes background refreshes of the same key
+
+_MISSING = object()
+
+
+def is_django_redis() -> bool:
+    """
+    True when the default cache is django-redis, i.e. raw Redis commands are available.
+    """
+    try:
+        from django_redis.cache import RedisCache
+    except ImportError:
+        return False
+    return isinstance(caches["default"], RedisCache)
+
+
+def make_envelope(value, timeout: int, delta: float) -> dict:
+    """
+    `expires` is the soft expiry: past it the value is stale but still servable until
+    the cache backend drops the entry (hard TTL = timeout + stale_ttl).
+    """
+    return {"value": value, "delta": delta, "expires": time.time() + timeout}
+
+
+def is_envelope(value) -> bool:
+    """
+    Entries written by anything but make_envelope (e.g. by an older release under the
+    same key) are not envelopes and are treated as a cache miss.
+    """
+    return isinstance(value, dict) and {"value", "delta", "expires"} <= value.keys()
+
+
+def _is_stale(envelope: dict) -> bool:
+    return time.time() >= envelope["expires"]
+
+
+def _should_refresh_early(envelope: dict, beta: float) -> bool:
+    """
+    Probabilistic early expiration (XFetch): the closer an entry is to its expiry and
+    the longer it took to compute, the more likely a reader volunteers to refresh it.
+    """
+    if beta <= 0:
+        return False
+    jitter = -envelope["delta"] * beta * math.log(1.0 - random.random())
+    return time.time() + jitter >= envelope["expires"]
+
+
+def _acquire_lock(key: str, lock_timeout: int):
+    """
+    Returns a held lock, None if another worker holds it, or True on cache backends
+    without lock support (every caller recomputes, same as a plain get/set).
+    """
+    if not hasattr(cache, "lock"):
+        return True
+    try:
+        lock = cache.lock(f"lock:{key}", timeout=lock_timeout)
+        return lock if lock.acquire(blocking=False) else None
+    except Exception as e:
+        logger.warning("[CACHE] Failed to acquire recompute lock - key=%s: %s", key, str(e))
+        return True
+
+
+def _release_lock(lock):
+    if lock is True:
+        return
+    try:
+        lock.release()
+    except Exception:
+        # lease already expired and possibly taken over by another worker
+        pass
+
+
+def _wait_for_value(key: str, wait_timeout: float):
+    deadline = time.monotonic() + wait_timeout
+    while time.monotonic() < deadline:
+        time.sleep(POLL_INTERVAL)
+        envelope = cache.get(key)
+        if is_envelope(envelope):
+            return envelope
+    return None
+
+
+def compute_and_store(key: str, compute, timeout: int, stale_ttl: int = 0):
+    started = time.monotonic()
+    value = compute()
+    envelope = make_envelope(value, timeout, time.monotonic() - started)
+    cache.set(key, envelope, timeout + stale_ttl)
+    return envelope
+
+
+def _schedule_refresh(key: str, refresh) -> bool:
+    """
+    Ask `refresh` to rebuild `key` out of band, at most once per REFRESH_MARKER_TIMEOUT.
+    Returns False if scheduling failed and the caller should rebuild inline instead.
+    """
+    if not cache.add(f"refresh:{key}", 1, REFRESH_MARKER_TIMEOUT):
+        return True
+    try:
+        refresh(key)
+        return True
+    except Exception as e:
+        cache.delete(f"refresh:{key}")
+        logger.warning("[CACHE] Failed to schedule background refresh - key=%s: %s", key, str(e))
+        return False
+
+
+def get_or_compute(
+    key: str,
+    compute,
+    timeout: int,
+    *,
+    envelope=_MISSING,
+    stale_ttl: int = 0,
+    refresh=None,
+    beta: float = EARLY_REFRESH_BETA,
+    lock_timeout: int = LOCK_TIMEOUT,
+    wait_timeout: float = WAIT_TIMEOUT,
+):
+    """
+    Single-flight cache read.
+
+    Only the worker holding the recompute lock for `key` calls `compute`; concurrent
+    readers get the current value if there is one, otherwise they briefly wait for the
+    lock holder to publish it. Entries are refreshed slightly before they expire with a
+    probability that grows as expiry approaches, so hot keys rarely expire at all.
+
+    With `stale_ttl` and `refresh` (a callable taking the key), entries past `timeout`
+    are served as-is for up to `stale_ttl` more seconds while `refresh` rebuilds them
+    in the background, typically by enqueuing a Celery task that calls
+    compute_and_store.
+
+    Pass `envelope` when the entry was already fetched (e.g. by a versioned lookup).
+    """
+    if envelope is _MISSING:
+        envelope = cache.get(key)
+    if not is_envelope(envelope):
+        envelope = None
+
+    if envelope is not None and not _is_stale(envelope):
+        if not _should_refresh_early(envelope, beta):
+            return envelope["value"]
+
+    if envelope is not None and refresh is not None:
+        if _schedule_refresh(key, refresh):
+            return envelope["value"]
+
+    lock = _acquire_lock(key, lock_timeout)
+    if lock is None:
+        if envelope is not None:
+            # someone else is already refreshing, keep serving the current value
+            return envelope["value"]
+
+        envelope = _wait_for_value(key, wait_timeout)
+        if envelope is not None:
+            return envelope["value"]
+        logger.warning("[CACHE] Timed out waiting for recompute - key=%s", key)
+        return compute()
+
+    try:
+        return compute_and_store(key, compute, timeout, stale_ttl)["value"]
+    finally:
+        _release_lock(lock)
@@ -0,0 +1,79 @@
+import hashlib
+from calendar import timegm
+
+from django.db.models import Count, F, Max, Sum
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+
+def make_etag(*parts) -> str:
+    """
+    Strong ETag over the given parts, e.g. a row count and a timestamp.
+    """
+    raw = ":".join(str(part) for part in parts)
+    return '"%s"' % hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+def to_timestamp(value):
+    """
+    Seconds since epoch for an aware datetime, as expected by get_conditional_response.
+    """
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    return timegm(value.utctimetuple())
+
+
+def queryset_validators(queryset, *parts, counter_fields=()):
+    """
+    (etag, last_modified) of a queryset from a single COUNT/MAX(updated_at) aggregate.
+    Creating, updating or deleting any row changes at least one of the two.
+    `parts` (e.g. the negotiated media type) are mixed into the ETag.
+
+    `counter_fields` are columns updated without touching updated_at (see
+    posts.services.counters); their sums go into the ETag. A pk-weighted sum is added
+    so that an increment on one row and a decrement on another do not cancel out. No
+    Last-Modified is returned then, as MAX(updated_at) does not move with the counters.
+    """
+    aggregates = {"count": Count("pk"), "last_modified": Max("updated_at")}
+    for field in counter_fields:
+        aggregates[f"{field}_sum"] = Sum(field)
+        aggregates[f"{field}_weighted"] = Sum(F(field) * F("pk"))
+    stats = queryset.order_by().aggregate(**aggregates)
+    last_modified = stats["last_modified"]
+    counters = [stats[name] for name in aggregates if name not in ("count", "last_modified")]
+    etag = make_etag(
+        queryset.model._meta.label, "count", stats["count"], last_modified, *counters, *parts
+    )
+    return etag, None if counter_fields else to_timestamp(last_modified)
+
+
+def instance_validators(instance, *parts):
+    """
+    (etag, last_modified) of a single row from its primary key and updated_at.
+    """
+    etag = make_etag(instance._meta.label, "pk", instance.pk, instance.updated_at, *parts)
+    return etag, to_timestamp(instance.updated_at)
+
+
+def set_validators(response, etag=None, last_modified=None):
+    if etag:
+        response["ETag"] = etag
+    if last_modified is not None:
+        response["Last-Modified"] = http_date(last_modified)
+    return response
+
+
+def conditional_response(request, build, etag=None, last_modified=None):
+    """
+    Answer If-None-Match / If-Modified-Since from the validators alone and only call
+    `build` (which returns the full response) when the client's copy is outdated.
+    """
+    last_modified = to_timestamp(last_modified)
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        response = build()
+    if 200 <= response.status_code < 300 or response.status_code == 304:
+        set_validators(response, etag, last_modified)
+    return response
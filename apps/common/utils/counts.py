@@ -0,0 +1,49 @@
+import json
+import logging
+
+from django.db import DatabaseError, connections
+
+logger = logging.getLogger(__name__)
+
+
+def _is_unfiltered(query) -> bool:
+    return not (query.where or query.distinct or query.combinator or query.is_sliced)
+
+
+def planner_estimate(queryset):
+    """
+    Number of rows PostgreSQL expects `queryset` to return, without running it.
+
+    An unfiltered queryset reads the table's pg_class.reltuples, anything else - and a
+    partitioned table, whose own reltuples autovacuum never maintains - the row estimate
+    of its EXPLAIN plan. Returns None on other backends, for tables that were
+    never analyzed and when the estimate can not be obtained.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+
+    try:
+        row = None
+        if _is_unfiltered(queryset.query):
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT reltuples, relkind FROM pg_class WHERE oid = %s::regclass",
+                    [connection.ops.quote_name(queryset.model._meta.db_table)],
+                )
+                row = cursor.fetchone()
+        if row and row[1] != "p":
+            estimate = row[0]
+        else:
+            plan = json.loads(queryset.order_by().explain(format="json"))
+            estimate = plan[0]["Plan"]["Plan Rows"]
+    except (DatabaseError, ValueError, KeyError, IndexError) as e:
+        logger.warning(
+            "[COUNT] Failed to estimate row count - model=%s: %s",
+            queryset.model._meta.label,
+            str(e),
+        )
+        return None
+
+    # reltuples is -1 until the first VACUUM / ANALYZE
+    return int(estimate) if estimate >= 0 else None
@@ -0,0 +1,129 @@
+import gzip
+import hashlib
+import json
+import re
+import time
+
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+
+from apps.common.utils.conditional import conditional_response, to_timestamp
+
+GZIP_MIN_LENGTH = 1024  # smaller bodies are not worth the Content-Encoding overhead
+GZIP_LEVEL = 6
+
+_renderer = JSONRenderer()
+_accepts_gzip_re = re.compile(r"\bgzip\b")
+
+
+def render_json(data) -> bytes:
+    """
+    `data` encoded exactly as JSONRenderer sends it.
+    """
+    return _renderer.render(data)
+
+
+def encode_body(body: bytes, last_modified=None) -> dict:
+    """
+    Cacheable payload for an already rendered JSON body: the body, its ETag, a
+    Last-Modified timestamp (defaults to now, i.e. when the payload was built) and, for
+    larger bodies, a gzip variant.
+    """
+    digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+    compressed = None
+    if len(body) >= GZIP_MIN_LENGTH:
+        compressed = gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+    return {
+        "body": body,
+        "etag": f'"{digest}"',
+        "last_modified": to_timestamp(last_modified) or int(time.time()),
+        "gzip": compressed,
+    }
+
+
+def encode_payload(data, last_modified=None) -> dict:
+    """
+    Render `data` once into a cacheable payload, see encode_body.
+    """
+    return encode_body(render_json(data), last_modified)
+
+
+def encode_list(items) -> dict:
+    """
+    Payload of a JSON array joined from already rendered items, e.g. cached post cards.
+    """
+    return encode_body(b"[" + b",".join(items) + b"]")
+
+
+def splice_fields(body: bytes, fields: dict) -> bytes:
+    """
+    Append top-level `fields` to an encoded JSON object without decoding it.
+    The fields must not already be present in `body`.
+    """
+    extra = _renderer.render(fields)
+    if body == b"{}":
+        return extra
+    return body[:-1] + b"," + extra[1:]
+
+
+def _accepts_gzip(request) -> bool:
+    return bool(_accepts_gzip_re.search(request.META.get("HTTP_ACCEPT_ENCODING", "")))
+
+
+def encoded_response(request, payload: dict, extra: dict = None, volatile: dict = None):
+    """
+    Send a payload from encode_payload as-is, skipping serialization and rendering.
+
+    Conditional requests are answered with 304 from the stored ETag and Last-Modified
+    before the body is touched.
+
+    `extra` holds dynamic top-level fields (e.g. engagement counters) spliced into the
+    cached body. Spliced responses are never compressed and carry a weak ETag over the
+    cached part and the `extra` values, and no Last-Modified, which could not tell when
+    those values changed. `volatile` fields are spliced in as well but left out of the
+    validators: values that move on every request, such as view counters, would
+    otherwise make every ETag unique. Clients negotiating a non-JSON renderer (the
+    browsable API) get a regular Response.
+    """
+    etag = payload["etag"]
+    last_modified = payload.get("last_modified")
+    spliced = {**(volatile or {}), **(extra or {})}
+
+    use_gzip = False
+    if spliced:
+        validated = etag.encode() + (render_json(extra) if extra else b"")
+        etag = f'W/"{hashlib.blake2b(validated, digest_size=16).hexdigest()}"'
+        if extra:
+            last_modified = None
+    elif payload["gzip"] is not None and _accepts_gzip(request):
+        # a different representation needs a different strong validator
+        etag = etag[:-1] + '-gzip"'
+        use_gzip = True
+
+    if not isinstance(getattr(request, "accepted_renderer", None), JSONRenderer):
+        etag = None  # validators only describe the JSON representation
+
+    def build():
+        if etag is None:
+            data = json.loads(payload["body"])
+            return Response({**data, **spliced} if spliced else data)
+
+        if use_gzip:
+            response = HttpResponse(payload["gzip"], content_type="application/json")
+            response["Content-Encoding"] = "gzip"
+        elif spliced:
+            body = splice_fields(payload["body"], spliced)
+            response = HttpResponse(body, content_type="application/json")
+        else:
+            response = HttpResponse(payload["body"], content_type="application/json")
+        return response
+
+    if etag is None:
+        return build()
+    response = conditional_response(request, build, etag, last_modified)
+    if payload["gzip"] is not None:
+        # also on 304s, so shared caches keep both encodings apart
+        patch_vary_headers(response, ("Accept-Encoding",))
+    return response
@@ -0,0 +1,122 @@
+import json
+import logging
+import threading
+import time
+
+from cachetools import TTLCache
+
+try:
+    from django_redis import get_redis_connection  # type: ignore
+except Exception:
+    get_redis_connection = None  # not on django-redis backend
+
+from apps.common.utils.cache import is_django_redis
+
+logger = logging.getLogger(__name__)
+
+LOCAL_CACHE_MAXSIZE = 1024  # entries per process, least recently used are evicted first
+LOCAL_CACHE_TTL = 30  # seconds; upper bound on staleness if an invalidation is missed
+INVALIDATION_CHANNEL = "cache:invalidate"
+RECONNECT_DELAY = 1.0
+
+_local = TTLCache(maxsize=LOCAL_CACHE_MAXSIZE, ttl=LOCAL_CACHE_TTL)
+_lock = threading.Lock()
+_listener = None
+
+_MISSING = object()
+
+
+def _is_enabled() -> bool:
+    # Without the Redis pub/sub channel processes could not evict each other's entries
+    return is_django_redis()
+
+
+def _evict(keys):
+    """
+    Drop exact keys; a key ending in "*" drops every entry with that prefix.
+    """
+    with _lock:
+        for key in keys:
+            if key.endswith("*"):
+                prefix = key[:-1]
+                for cached_key in [k for k in _local.keys() if k.startswith(prefix)]:
+                    _local.pop(cached_key, None)
+            else:
+                _local.pop(key, None)
+
+
+def _clear():
+    with _lock:
+        _local.clear()
+
+
+def _listen():
+    while True:
+        try:
+            pubsub = get_redis_connection("default").pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(INVALIDATION_CHANNEL)
+            # anything may have changed while we were not subscribed
+            _clear()
+            for message in pubsub.listen():
+                _evict(json.loads(message["data"]))
+        except Exception as e:
+            logger.warning("[CACHE] Local cache invalidation listener failed: %s", str(e))
+            _clear()
+            time.sleep(RECONNECT_DELAY)
+
+
+def _ensure_listener():
+    global _listener
+
+    if _listener is not None:
+        return
+    with _lock:
+        if _listener is None:
+            _listener = threading.Thread(
+                target=_listen, name="local-cache-invalidation", daemon=True
+            )
+            _listener.start()
+
+
+def local_get(key: str, default=None):
+    """
+    Per-process read. Cached values are shared between requests, treat them as read-only.
+    """
+    if not _is_enabled():
+        return default
+    _ensure_listener()
+    with _lock:
+        return _local.get(key, default)
+
+
+def local_set(key: str, value):
+    if not _is_enabled():
+        return
+    _ensure_listener()
+    with _lock:
+        _local[key] = value
+
+
+def publish_invalidation(*keys: str):
+    """
+    Evict keys from the local cache of every process, this one included.
+    """
+    if not keys or not _is_enabled():
+        return
+    _evict(keys)
+    try:
+        get_redis_connection("default").publish(INVALIDATION_CHANNEL, json.dumps(keys))
+    except Exception as e:
+        logger.warning("[CACHE] Failed to publish local cache invalidation: %s", str(e))
+
+
+def local_get_or_set(key: str, compute):
+    """
+    Serve `key` from the per-process cache, falling back to `compute` (usually a Redis
+    backed get_or_compute call) and remembering its result for LOCAL_CACHE_TTL seconds.
+    """
+    value = local_get(key, _MISSING)
+    if value is _MISSING:
+        value = compute()
+        local_set(key, value)
+    return value
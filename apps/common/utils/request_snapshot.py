@@ -0,0 +1,42 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.http import HttpRequest, QueryDict
+from rest_framework.request import Request
+
+
+def snapshot_request(request) -> dict:
+    """
+    JSON-serializable description of a GET request, enough to rebuild the same
+    response outside of the request cycle (e.g. in a Celery task).
+    """
+    return {
+        "path": request.path,
+        "query_string": request.META.get("QUERY_STRING", ""),
+        "host": request.get_host(),
+        "secure": request.is_secure(),
+        "user_id": request.user.pk if request.user.is_authenticated else None,
+    }
+
+
+def build_request(snapshot: dict) -> Request:
+    """
+    Rebuild a DRF request from snapshot_request output.
+    """
+    http_request = HttpRequest()
+    http_request.method = "GET"
+    http_request.path = http_request.path_info = snapshot["path"]
+    http_request.GET = QueryDict(snapshot["query_string"])
+    http_request.META["QUERY_STRING"] = snapshot["query_string"]
+    http_request.META["HTTP_HOST"] = snapshot["host"]
+    if snapshot["secure"] and settings.SECURE_PROXY_SSL_HEADER:
+        header, value = settings.SECURE_PROXY_SSL_HEADER
+        http_request.META[header] = value
+
+    user = None
+    if snapshot["user_id"] is not None:
+        user = get_user_model().objects.filter(pk=snapshot["user_id"]).first()
+
+    request = Request(http_request)
+    request.user = user or AnonymousUser()
+    return request
@@ -5,6 +5,7 @@ from rest_framework.viewsets import GenericViewSet
 
 from apps.favourites.models import Favourite
 from apps.posts.models import Post
+from apps.posts.services.post_cards import post_card_fields
 
 from .serializers import FavouriteSerializer
 
@@ -18,9 +19,8 @@ class FavouriteViewSet(mixins.ListModelMixin, GenericViewSet):
         # TODO with post statuses
         qs = (
             Favourite.objects.filter(user=self.request.user, post__status=Post.Status.PUBLISHED)
-            .select_related("user", "post")
-            .prefetch_related("post__images")
             .order_by("-created_at")
+            .values("id", "user", "created_at", "updated_at", *post_card_fields("post__"))
         )
 
         return qs
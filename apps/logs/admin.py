@@ -1,10 +1,93 @@
 from django.contrib import admin
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.contrib.admin.views.main import ORDER_VAR, PAGE_VAR, ChangeList
 from django.utils.html import format_html
 from unfold.admin import ModelAdmin
 from unfold.decorators import display
 
+from apps.common.pagination import (
+    EstimatedCountPaginator,
+    decode_cursor,
+    encode_cursor,
+    seek_after,
+)
+
 from .models import LogEntry
 
+CURSOR_VAR = "cursor"
+
+
+class LevelListFilter(admin.SimpleListFilter):
+    # fixed choices: the default filter would scan the table for its distinct levels
+    title = "level"
+    parameter_name = "level"
+
+    def lookups(self, request, model_admin):
+        return [(name, name) for name in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")]
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(level=self.value())
+        return queryset
+
+
+class KeysetPaginator(EstimatedCountPaginator):
+    template_name = "admin/logs/logentry/pagination_keyset.html"
+
+
+class LogEntryChangeList(ChangeList):
+    """
+    Pages the default newest-first listing by (timestamp, id): `cursor` carries the
+    last row of the previous page, so every page is one index range scan no matter
+    how deep it is. Sorting by a column falls back to page numbers.
+    """
+
+    def __init__(self, request, *args, **kwargs):
+        # get_results() runs inside ChangeList.__init__
+        self.cursor = request.GET.get(CURSOR_VAR) or None
+        self.next_url = None
+        super().__init__(request, *args, **kwargs)
+        # filter and sort links start over from the newest rows
+        self.params.pop(CURSOR_VAR, None)
+        self.newest_url = self.get_query_string(remove=[CURSOR_VAR, PAGE_VAR])
+        if self.next_cursor:
+            self.next_url = self.get_query_string(
+                {CURSOR_VAR: self.next_cursor}, remove=[PAGE_VAR]
+            )
+
+    def get_filters_params(self, params=None):
+        lookup_params = super().get_filters_params(params)
+        lookup_params.pop(CURSOR_VAR, None)
+        return lookup_params
+
+    def get_results(self, request):
+        self.next_cursor = None
+        if self.params.get(ORDER_VAR) or self.show_all:
+            return super().get_results(request)
+
+        queryset = self.queryset.order_by("-timestamp", "-pk")
+        if self.cursor:
+            try:
+                value, pk = decode_cursor(self.cursor, self.opts.get_field("timestamp"))
+            except ValueError:
+                raise IncorrectLookupParameters
+            queryset = queryset.filter(seek_after("timestamp", value, pk))
+
+        rows = list(queryset[: self.list_per_page + 1])
+        self.result_list = rows[: self.list_per_page]
+        if len(rows) > self.list_per_page:
+            last = self.result_list[-1]
+            self.next_cursor = encode_cursor(last.timestamp, last.pk)
+
+        self.paginator = KeysetPaginator(self.queryset, self.list_per_page)
+        self.result_count = self.paginator.count  # the planner's estimate on large tables
+        self.full_result_count = None
+        self.show_full_result_count = False
+        self.show_admin_actions = True
+        self.can_show_all = False
+        self.multi_page = bool(self.cursor or self.next_cursor)
+
+
 @admin.register(LogEntry)
 class LogEntryAdmin(ModelAdmin):
     list_display = [
@@ -16,7 +99,7 @@ class LogEntryAdmin(ModelAdmin):
         "timestamp_display",
     ]
     list_filter = [
-        "level",
+        LevelListFilter,
         "timestamp",
     ]
     search_fields = [
@@ -28,6 +111,9 @@ class LogEntryAdmin(ModelAdmin):
     readonly_fields = ("id", "timestamp", "level", "logger_name", "message", "pathname", "line_no",
                        "exception")
     list_per_page = 50
+    ordering = ("-timestamp", "-id")
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
     fieldsets = (
         ("Log Information", {
@@ -41,6 +127,9 @@ class LogEntryAdmin(ModelAdmin):
         }),
     )
 
+    def get_changelist(self, request, **kwargs):
+        return LogEntryChangeList
+
     @display(description="Level Badge")
     def level_badge(self, obj):
         colors = {
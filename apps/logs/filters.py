@@ -0,0 +1,137 @@
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_ATTR = "log_sampling_summary"  # marks the summary records, which always pass
+
+
+@dataclass
+class SamplingRule:
+    """
+    Records of `logger` (and its children) whose message template starts with `prefix`.
+    An empty logger or prefix matches everything.
+
+    `sample_rate` is the fraction of matching records kept; `rate` caps the kept ones
+    to that many records per second for the whole rule, allowing bursts of `burst`.
+    """
+
+    logger: str = ""
+    prefix: str = ""
+    sample_rate: float = 1.0
+    rate: Optional[float] = None
+    burst: Optional[float] = None
+    tokens: float = field(default=0.0, init=False)
+    refilled_at: float = field(default=0.0, init=False)
+
+    def __post_init__(self):
+        if not 0.0 <= self.sample_rate <= 1.0:
+            raise ValueError(f"sample_rate must be between 0 and 1, got {self.sample_rate}")
+        if self.rate is not None and self.rate <= 0:
+            raise ValueError(f"rate must be positive, got {self.rate}")
+        if self.burst is None and self.rate is not None:
+            self.burst = max(1.0, self.rate)
+        self.tokens = self.burst or 0.0
+        self.refilled_at = time.monotonic()
+
+    def matches(self, record) -> bool:
+        if self.logger and not (
+            record.name == self.logger or record.name.startswith(f"{self.logger}.")
+        ):
+            return False
+        return not self.prefix or str(record.msg).startswith(self.prefix)
+
+    def take_token(self, now: float) -> bool:
+        if self.rate is None:
+            return True
+        self.tokens = min(self.burst, self.tokens + (now - self.refilled_at) * self.rate)
+        self.refilled_at = now
+        if self.tokens < 1.0:
+            return False
+        self.tokens -= 1.0
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Thins out high-volume log categories before they reach a handler.
+
+    A record below `pass_level` is checked against `rules` in order, and the first
+    matching rule samples and rate-limits it; records matching no rule, and any record
+    at or above `pass_level`, always pass. Dropped records are counted per logger, level
+    and message template, and every `summary_interval` seconds the counts are logged as
+    "[LOGS] N similar messages suppressed" records by the next record that comes by.
+
+    Configured through LOGGING["filters"], e.g.
+
+        "sampling": {
+            "()": "apps.logs.filters.SamplingFilter",
+            "rules": [{"prefix": "[CACHE]", "sample_rate": 0.01, "rate": 5}],
+        }
+
+    One instance may be attached to several handlers: the decision is taken once per
+    record and reused, so all handlers keep or drop the same records.
+    """
+
+    def __init__(self, rules=(), pass_level="WARNING", summary_interval=60.0):
+        super().__init__()
+        self.rules = [SamplingRule(**rule) for rule in rules]
+        if isinstance(pass_level, str):
+            pass_level = logging.getLevelNamesMapping()[pass_level]
+        self.pass_level = pass_level
+        self.summary_interval = summary_interval
+        self._decision_attr = f"_log_sampling_{id(self)}"
+        self._lock = threading.Lock()
+        self._suppressed = {}  # (logger name, level name, template) -> count
+        self._summary_at = time.monotonic() + summary_interval
+
+    def filter(self, record):
+        if getattr(record, SUMMARY_ATTR, False):
+            return True
+        decision = record.__dict__.get(self._decision_attr)
+        if decision is None:
+            decision = self._decide(record)
+            record.__dict__[self._decision_attr] = decision
+            self._report_suppressed()
+        return decision
+
+    def _decide(self, record) -> bool:
+        if record.levelno >= self.pass_level:
+            return True
+        rule = next((rule for rule in self.rules if rule.matches(record)), None)
+        if rule is None:
+            return True
+
+        with self._lock:
+            if rule.sample_rate < 1.0 and random.random() >= rule.sample_rate:
+                keep = False
+            else:
+                keep = rule.take_token(time.monotonic())
+            if not keep:
+                key = (record.name, record.levelname, str(record.msg))
+                self._suppressed[key] = self._suppressed.get(key, 0) + 1
+        return keep
+
+    def _report_suppressed(self):
+        with self._lock:
+            now = time.monotonic()
+            if now < self._summary_at:
+                return
+            self._summary_at = now + self.summary_interval
+            suppressed, self._suppressed = self._suppressed, {}
+
+        # logged outside the lock: the summaries come back through this filter
+        for (name, level, template), count in suppressed.items():
+            logger.info(
+                "[LOGS] %s similar messages suppressed in %ss - logger=%s, level=%s, message=%s",
+                count,
+                self.summary_interval,
+                name,
+                level,
+                template,
+                extra={SUMMARY_ATTR: True},
+            )
@@ -1,21 +1,144 @@
 import logging
-
-from django.utils import timezone
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
 
 
 class DatabaseHandler(logging.Handler):
+    """
+    Stores records as LogEntry rows without touching the database on the logging thread.
+
+    emit() only formats the record and appends it to a bounded in-memory queue. A daemon
+    thread saves the queue with bulk_create, `batch_size` rows at a time, as soon as a
+    batch is full or `flush_interval` seconds after the previous write. When the queue
+    holds `capacity` records the oldest one is dropped; drops are counted in `dropped`
+    and reported as a WARNING entry with the next batch. close() - called by
+    logging.shutdown() at exit - writes everything still queued.
+    """
+
+    def __init__(self, level=logging.NOTSET, capacity=10_000, batch_size=200, flush_interval=2.0):
+        super().__init__(level)
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0  # records lost to a full queue or a failed write, ever
+        self._init_queue()
+        os.register_at_fork(after_in_child=self._init_queue)
+
+    def _init_queue(self):
+        # a forked child neither inherits the writer thread nor the parent's backlog
+        self._queue = deque()
+        self._condition = threading.Condition()
+        self._unreported_drops = 0
+        self._closed = False
+        self._writer = None
+
     def emit(self, record):
         try:
-            from apps.logs.models import LogEntry
+            entry = {
+                "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc),
+                "level": record.levelname,
+                "logger_name": record.name,
+                "message": self.format(record),
+                "pathname": record.pathname,
+                "line_no": record.lineno,
+                "exception": record.exc_text or None,  # set by format() for exc_info
+            }
+        except Exception:
+            self.handleError(record)
+            return
+
+        with self._condition:
+            if self._closed:
+                return
+            if len(self._queue) >= self.capacity:
+                self._queue.popleft()
+                self._count_drops(1)
+            self._queue.append(entry)
+            if len(self._queue) >= self.batch_size:
+                self._condition.notify()
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._run, name="log-db-writer", daemon=True)
+                self._writer.start()
+
+    def _count_drops(self, count):
+        self.dropped += count
+        self._unreported_drops += count
 
-            LogEntry.objects.create(
-                timestamp=timezone.now(),
-                level=record.levelname,
-                logger_name=record.name,
-                message=self.format(record),
-                pathname=record.pathname,
-                line_no=record.lineno,
-                exception=record.exc_info if record.exc_info else None,
+    def _take_batch(self):
+        """
+        Up to `batch_size` queued entries plus a report of unreported drops, and the
+        number of drops that report covers. Caller holds self._condition.
+        """
+        batch = [self._queue.popleft() for _ in range(min(len(self._queue), self.batch_size))]
+        reported = self._unreported_drops
+        if reported:
+            batch.append(
+                {
+                    "timestamp": datetime.fromtimestamp(time.time(), tz=timezone.utc),
+                    "level": "WARNING",
+                    "logger_name": __name__,
+                    "message": (
+                        f"[LOGS] Dropped {reported} log records - capacity={self.capacity}"
+                    ),
+                    "pathname": __file__,
+                    "line_no": None,
+                    "exception": None,
+                }
             )
+            self._unreported_drops = 0
+        return batch, reported
+
+    def _run(self):
+        from django.db import close_old_connections
+
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: self._closed or len(self._queue) >= self.batch_size,
+                    timeout=self.flush_interval,
+                )
+                if self._closed:
+                    return  # close() writes the rest
+                batch, reported = self._take_batch()
+            if batch:
+                # this thread keeps its own connection, drop it once it went stale
+                close_old_connections()
+                self._write(batch, reported)
+
+    def _write(self, batch, reported=0) -> bool:
+        if not batch:
+            return True
+        try:
+            from apps.logs.models import LogEntry
+
+            LogEntry.objects.bulk_create([LogEntry(**entry) for entry in batch])
+            return True
         except Exception:
-            pass
+            # never raise from logging; the loss shows up in the next drop report
+            with self._condition:
+                self._count_drops(len(batch) - (1 if reported else 0))
+                self._unreported_drops += reported
+            return False
+
+    def flush(self):
+        """
+        Write everything queued so far from the calling thread.
+        """
+        while True:
+            with self._condition:
+                batch, reported = self._take_batch()
+            if not batch or not self._write(batch, reported):
+                return
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+            writer = self._writer
+        if writer is not None and writer is not threading.current_thread():
+            writer.join(timeout=self.flush_interval + 5)
+        self.flush()
+        super().close()
@@ -0,0 +1,100 @@
+# Generated by Django 5.2.9 on 2026-10-17 03:41
+
+from datetime import datetime, time, timedelta, timezone
+
+from django.conf import settings
+from django.db import migrations, models
+
+PREMAKE_DAYS = 7
+
+# Same columns as before; the primary key must include the partition key.
+CREATE_PARTITIONED_TABLE = [
+    'CREATE SEQUENCE "Log_entry_partitioned_id_seq"',
+    """
+    CREATE TABLE "Log_entry" (
+        "id" bigint NOT NULL DEFAULT nextval('"Log_entry_partitioned_id_seq"'),
+        "timestamp" timestamp with time zone NOT NULL,
+        "level" varchar(30) NOT NULL,
+        "logger_name" varchar(255) NOT NULL,
+        "message" text NOT NULL,
+        "pathname" varchar(500) NULL,
+        "line_no" integer NULL,
+        "exception" text NULL,
+        CONSTRAINT "Log_entry_partitioned_pkey" PRIMARY KEY ("id", "timestamp")
+    ) PARTITION BY RANGE ("timestamp")
+    """,
+    'ALTER SEQUENCE "Log_entry_partitioned_id_seq" OWNED BY "Log_entry"."id"',
+    'CREATE TABLE "Log_entry_default" PARTITION OF "Log_entry" DEFAULT',
+]
+
+# Once the old table (and its pkey index and id sequence) is gone, take over their names.
+TAKE_OVER_NAMES = [
+    'ALTER TABLE "Log_entry" RENAME CONSTRAINT "Log_entry_partitioned_pkey" TO "Log_entry_pkey"',
+    'ALTER SEQUENCE "Log_entry_partitioned_id_seq" RENAME TO "Log_entry_id_seq"',
+]
+
+COLUMNS = '"id", "timestamp", "level", "logger_name", "message", "pathname", "line_no", "exception"'
+
+
+def _day_start(day):
+    return datetime.combine(day, time.min, tzinfo=timezone.utc)
+
+
+def partition_log_entries(apps, schema_editor):
+    """
+    Rebuild Log_entry as a table range-partitioned by day. Rows inside the retention
+    window are copied over; older ones would be dropped by the first retention run
+    anyway and are discarded with the old table.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    retention_days = getattr(settings, "LOG_RETENTION_DAYS", 30)
+    today = datetime.now(timezone.utc).date()
+    first_day = today - timedelta(days=retention_days)
+
+    schema_editor.execute('ALTER TABLE "Log_entry" RENAME TO "Log_entry_legacy"')
+    for statement in CREATE_PARTITIONED_TABLE:
+        schema_editor.execute(statement)
+    for offset in range((today - first_day).days + PREMAKE_DAYS + 1):
+        day = first_day + timedelta(days=offset)
+        schema_editor.execute(
+            f'CREATE TABLE "Log_entry_p{day:%Y%m%d}" PARTITION OF "Log_entry" '
+            f"FOR VALUES FROM ('{_day_start(day).isoformat()}') "
+            f"TO ('{_day_start(day + timedelta(days=1)).isoformat()}')"
+        )
+
+    schema_editor.execute(
+        f'INSERT INTO "Log_entry" ({COLUMNS}) SELECT {COLUMNS} FROM "Log_entry_legacy" '
+        'WHERE "timestamp" >= %s',
+        [_day_start(first_day)],
+    )
+    schema_editor.execute(
+        "SELECT setval('\"Log_entry_partitioned_id_seq\"', "
+        'GREATEST((SELECT MAX("id") FROM "Log_entry_legacy"), 1))'
+    )
+    schema_editor.execute('DROP TABLE "Log_entry_legacy"')
+    for statement in TAKE_OVER_NAMES:
+        schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("logs", "0002_logentry_timestamp_default"),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_log_entries, migrations.RunPython.noop),
+        # created on the partitioned table, PostgreSQL adds them to every partition
+        migrations.AddIndex(
+            model_name="logentry",
+            index=models.Index(fields=["timestamp", "level"], name="log_entry_time_level_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="logentry",
+            index=models.Index(
+                fields=["logger_name", "timestamp"], name="log_entry_logger_time_idx"
+            ),
+        ),
+    ]
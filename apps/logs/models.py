@@ -1,8 +1,15 @@
 from django.db import models
+from django.utils import timezone
 
 
 class LogEntry(models.Model):
-    timestamp = models.DateTimeField(auto_now_add=True)
+    """
+    On PostgreSQL the table is range-partitioned by day on `timestamp` (see
+    apps.logs.partitions); its primary key is (id, timestamp).
+    """
+
+    # time of the log record, not of the (batched) insert
+    timestamp = models.DateTimeField(default=timezone.now)
     level = models.CharField(max_length=30)
     logger_name = models.CharField(max_length=255)
     message = models.TextField()
@@ -17,3 +24,7 @@ class LogEntry(models.Model):
         db_table = "Log_entry"
         verbose_name = "Log Entry"
         verbose_name_plural = "Log Entries"
+        indexes = [
+            models.Index(fields=["timestamp", "level"], name="log_entry_time_level_idx"),
+            models.Index(fields=["logger_name", "timestamp"], name="log_entry_logger_time_idx"),
+        ]
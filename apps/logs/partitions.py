@@ -0,0 +1,102 @@
+import logging
+import re
+from datetime import datetime, time, timedelta, timezone
+
+from django.db import connection
+
+from apps.logs.models import LogEntry
+
+logger = logging.getLogger(__name__)
+
+# LogEntry rows live in one partition per UTC day, named after the day, plus a DEFAULT
+# partition for rows outside every daily range (normally empty). Expired days are
+# removed with DROP TABLE, which frees their space at once, unlike DELETE + VACUUM.
+PARTITION_PREMAKE_DAYS = 7  # daily partitions kept ready ahead of today
+
+_PARTITION_NAME = re.compile(rf"^{re.escape(LogEntry._meta.db_table)}_p(\d{{8}})$")
+
+
+def partition_name(day) -> str:
+    return f"{LogEntry._meta.db_table}_p{day:%Y%m%d}"
+
+
+def _day_start(day) -> datetime:
+    return datetime.combine(day, time.min, tzinfo=timezone.utc)
+
+
+def _is_partitioned() -> bool:
+    if connection.vendor != "postgresql":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s)",
+            [connection.ops.quote_name(LogEntry._meta.db_table)],
+        )
+        return cursor.fetchone() is not None
+
+
+def log_partitions() -> dict:
+    """
+    Daily partitions of the LogEntry table, {day: table name}.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = to_regclass(%s)",
+            [connection.ops.quote_name(LogEntry._meta.db_table)],
+        )
+        names = [name for (name,) in cursor.fetchall()]
+    partitions = {}
+    for name in names:
+        match = _PARTITION_NAME.match(name)
+        if match:
+            partitions[datetime.strptime(match.group(1), "%Y%m%d").date()] = name
+    return partitions
+
+
+def create_log_partitions(days_ahead: int = PARTITION_PREMAKE_DAYS) -> list:
+    """
+    Create the missing daily partitions from today to `days_ahead` days from now.
+    Returns the names of the partitions created; nothing happens off PostgreSQL.
+    """
+    if not _is_partitioned():
+        return []
+
+    existing = log_partitions()
+    today = datetime.now(timezone.utc).date()
+    quote = connection.ops.quote_name
+    created = []
+    with connection.cursor() as cursor:
+        for offset in range(days_ahead + 1):
+            day = today + timedelta(days=offset)
+            if day in existing:
+                continue
+            # DDL takes no parameters; the bounds are generated timestamps
+            cursor.execute(
+                f"CREATE TABLE IF NOT EXISTS {quote(partition_name(day))} "
+                f"PARTITION OF {quote(LogEntry._meta.db_table)} "
+                f"FOR VALUES FROM ('{_day_start(day).isoformat()}') "
+                f"TO ('{_day_start(day + timedelta(days=1)).isoformat()}')"
+            )
+            created.append(partition_name(day))
+    return created
+
+
+def drop_expired_log_partitions(retention_days: int) -> list:
+    """
+    Drop the daily partitions whose rows are all older than `retention_days` days.
+    Returns the names of the partitions dropped; nothing happens off PostgreSQL.
+    """
+    if not _is_partitioned():
+        return []
+
+    cutoff = datetime.now(timezone.utc).date() - timedelta(days=retention_days)
+    quote = connection.ops.quote_name
+    dropped = []
+    with connection.cursor() as cursor:
+        for day, name in sorted(log_partitions().items()):
+            if day + timedelta(days=1) <= cutoff:
+                cursor.execute(f"DROP TABLE IF EXISTS {quote(name)}")
+                dropped.append(name)
+    return dropped
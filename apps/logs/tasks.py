@@ -0,0 +1,25 @@
+import logging
+
+from celery import shared_task
+from django.conf import settings
+
+from apps.logs.partitions import create_log_partitions, drop_expired_log_partitions
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def maintain_log_partitions():
+    """
+    Keep the upcoming daily LogEntry partitions ready and drop the ones past
+    LOG_RETENTION_DAYS, which releases their rows without a DELETE.
+    """
+    created = create_log_partitions()
+    dropped = drop_expired_log_partitions(settings.LOG_RETENTION_DAYS)
+    if created or dropped:
+        logger.info(
+            "[LOGS] Log partitions maintained - created=%s, dropped=%s",
+            ",".join(created) or "-",
+            ",".join(dropped) or "-",
+        )
+    return f"Created {len(created)}, dropped {len(dropped)} log partitions."
@@ -3,8 +3,11 @@ import logging
 
 from channels.db import database_sync_to_async
 from channels.generic.websocket import AsyncWebsocketConsumer
+from django.db import transaction
 
+from apps.notifications.dispatcher import notification_group
 from apps.notifications.models import CommentNotification
+from apps.notifications.services import adjust_unread_count
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +20,7 @@ class CommentNotificationConsumer(AsyncWebsocketConsumer):
             return
 
         self.comment_notification_room_id = str(self.user.pk)
-        self.room_group_name = f"comment_notification_room_id_{self.comment_notification_room_id}"
+        self.room_group_name = notification_group(self.comment_notification_room_id)
         await self.channel_layer.group_add(self.room_group_name, self.channel_name)
         await self.accept()
 
@@ -77,6 +80,19 @@ class CommentNotificationConsumer(AsyncWebsocketConsumer):
 
         await self.send(text_data=json.dumps({"type": "comment_notification", "payload": payload}))
 
+    async def comment_notification_batch(self, event):
+        """
+        {
+            'type': 'comment_notification_batch',
+            'payloads': [... serialized notifications, oldest first ...]
+        }
+        Sent by the notification dispatcher; clients still get one frame per notification.
+        """
+        for payload in event.get("payloads", []):
+            await self.send(
+                text_data=json.dumps({"type": "comment_notification", "payload": payload})
+            )
+
     @database_sync_to_async
     def mark_as_read_bulk(self, ids):
         """
@@ -85,6 +101,8 @@ class CommentNotificationConsumer(AsyncWebsocketConsumer):
         """
         qs = CommentNotification.objects.filter(id__in=ids, receiver_id=self.user.pk, is_read=False)
         updated = qs.update(is_read=True)
+        # update() sends no signals
+        transaction.on_commit(lambda: adjust_unread_count(self.user.pk, -updated))
         return updated
 
     @database_sync_to_async
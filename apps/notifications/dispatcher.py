@@ -0,0 +1,147 @@
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+
+from channels.layers import get_channel_layer
+from django.db import close_old_connections
+
+from apps.notifications.models import CommentNotification
+from apps.notifications.serializers import CommentNotificationReadSerializer
+from apps.notifications.services import get_unread_counts
+
+logger = logging.getLogger(__name__)
+
+DISPATCH_WINDOW = 0.25  # seconds events of a receiver are collected before one push
+DISPATCH_CAPACITY = 10_000  # queued notifications; beyond it new ones are not pushed
+
+
+def notification_group(receiver_id) -> str:
+    return f"comment_notification_room_id_{receiver_id}"
+
+
+class NotificationDispatcher:
+    """
+    Pushes new comment notifications to their receivers' websocket groups off the
+    request thread.
+
+    enqueue() only records (receiver, notification id). A daemon thread waits
+    DISPATCH_WINDOW seconds after the first queued event, then serializes everything
+    queued with one query per batch, reads the receivers' unread counters and sends one
+    "comment_notification_batch" message per receiver, all groups concurrently on the
+    thread's own event loop. A push that is lost - full queue, channel layer down,
+    process exit - only delays the notification until the client reloads its inbox; the
+    row itself is already committed.
+    """
+
+    def __init__(self, window=DISPATCH_WINDOW, capacity=DISPATCH_CAPACITY):
+        self.window = window
+        self.capacity = capacity
+        self._init_queue()
+        os.register_at_fork(after_in_child=self._init_queue)
+
+    def _init_queue(self):
+        # a forked child neither inherits the dispatcher thread nor the parent's queue
+        self._pending = defaultdict(list)  # receiver id -> notification ids
+        self._size = 0
+        self._condition = threading.Condition()
+        self._thread = None
+        self._loop = None
+
+    def enqueue(self, receiver_id, notification_id):
+        with self._condition:
+            if self._size >= self.capacity:
+                logger.warning(
+                    "[NOTIFICATION] Dispatch queue full, push skipped - "
+                    "notification_id=%s, receiver_id=%s",
+                    notification_id,
+                    receiver_id,
+                )
+                return
+            self._pending[receiver_id].append(notification_id)
+            self._size += 1
+            self._condition.notify()
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="notification-dispatcher", daemon=True
+                )
+                self._thread.start()
+
+    def _take_pending(self) -> dict:
+        with self._condition:
+            pending, self._pending = self._pending, defaultdict(list)
+            self._size = 0
+        return pending
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._size > 0)
+            # let the events of the next few moments join this batch
+            time.sleep(self.window)
+            try:
+                close_old_connections()
+                self._dispatch(self._take_pending())
+            except Exception:
+                # keep the thread alive, enqueue() never starts a second one
+                logger.exception("[NOTIFICATION] Notification dispatcher round failed")
+
+    def _dispatch(self, pending: dict):
+        # runs on the dispatcher thread, which owns self._loop
+        if not pending:
+            return
+        try:
+            messages = self._build_messages(pending)
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+            self._loop.run_until_complete(self._send(messages))
+        except Exception as e:
+            logger.error(
+                "[NOTIFICATION] Failed to push notifications - receivers=%s: %s",
+                len(pending),
+                str(e),
+            )
+
+    def _build_messages(self, pending: dict) -> dict:
+        ids = [notification_id for ids in pending.values() for notification_id in ids]
+        notifications = defaultdict(list)
+        for notification in (
+            CommentNotification.objects.filter(id__in=ids)
+            .select_related("sender", "receiver", "comment__post")
+            .order_by("created_at", "id")
+        ):
+            notifications[notification.receiver_id].append(notification)
+        unread_counts = get_unread_counts(notifications)
+
+        messages = {}
+        for receiver_id, receiver_notifications in notifications.items():
+            payloads = CommentNotificationReadSerializer(
+                receiver_notifications,
+                many=True,
+                context={"unread_count": unread_counts.get(receiver_id, 0)},
+            ).data
+            messages[notification_group(receiver_id)] = {
+                "type": "comment_notification_batch",
+                "payloads": payloads,
+            }
+        return messages
+
+    async def _send(self, messages: dict):
+        channel_layer = get_channel_layer()
+        groups = list(messages)
+        results = await asyncio.gather(
+            *(channel_layer.group_send(group, messages[group]) for group in groups),
+            return_exceptions=True,
+        )
+        for group, result in zip(groups, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    "[NOTIFICATION] Failed to push notifications - group=%s: %s",
+                    group,
+                    str(result),
+                )
+
+
+dispatcher = NotificationDispatcher()
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.9 on 2026-10-17 03:30
+
+import django.contrib.postgres.operations
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # built concurrently so writes to CommentNotifications are not blocked meanwhile
+    atomic = False
+
+    dependencies = [
+        ("notifications", "0002_commentnotification_is_read"),
+    ]
+
+    operations = [
+        django.contrib.postgres.operations.AddIndexConcurrently(
+            model_name="commentnotification",
+            index=models.Index(
+                fields=["receiver", "-created_at"], name="notif_receiver_created_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.9 on 2026-10-17 03:48
+
+import django.contrib.postgres.operations
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # built concurrently so writes to CommentNotifications are not blocked meanwhile
+    atomic = False
+
+    dependencies = [
+        ("notifications", "0003_notification_receiver_created_index"),
+    ]
+
+    operations = [
+        django.contrib.postgres.operations.AddIndexConcurrently(
+            model_name="commentnotification",
+            index=models.Index(
+                condition=models.Q(("is_read", False)),
+                fields=["receiver"],
+                name="notif_receiver_unread_idx",
+            ),
+        ),
+    ]
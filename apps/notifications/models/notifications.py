@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models import Q
 
 from apps.common.models import BaseModel
 
@@ -21,6 +22,14 @@ class CommentNotification(BaseModel):
         verbose_name = "Comment Notification"
         verbose_name_plural = "Comment Notifications"
         ordering = ["-created_at"]
+        indexes = [
+            # inbox of a receiver, newest first, paged by (created_at, id)
+            models.Index(fields=["receiver", "-created_at"], name="notif_receiver_created_idx"),
+            # unread counts of a receiver, when its Redis counter has to be rebuilt
+            models.Index(
+                fields=["receiver"], condition=Q(is_read=False), name="notif_receiver_unread_idx"
+            ),
+        ]
 
     def __str__(self):
         return f"Notification to {self.receiver} from {self.sender}"
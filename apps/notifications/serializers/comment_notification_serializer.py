@@ -1,6 +1,8 @@
+from django.db import transaction
 from rest_framework import serializers
 
 from apps.notifications.models import CommentNotification
+from apps.notifications.services import adjust_unread_count
 from apps.users.serializers import PublicUserSerializer
 
 
@@ -45,7 +47,10 @@ class MarkAsReadSerializer(serializers.Serializer):
         user = self.context["request"].user
         ids = self.validated_data.pop("ids")
         qs = CommentNotification.objects.filter(id__in=ids, receiver_id=user.pk, is_read=False)
-        return qs.update(is_read=True)
+        updated = qs.update(is_read=True)
+        # update() sends no signals
+        transaction.on_commit(lambda: adjust_unread_count(user.pk, -updated))
+        return updated
 
 
 class DeleteCommentNotificationSerializer(serializers.Serializer):
@@ -0,0 +1 @@
+from .unread_counts import adjust_unread_count, get_unread_count, get_unread_counts
@@ -0,0 +1,158 @@
+import logging
+
+from django.db.models import Count
+from django_redis import get_redis_connection
+
+from apps.notifications.models import CommentNotification
+
+logger = logging.getLogger(__name__)
+
+redis = get_redis_connection("default")
+
+UNREAD_COUNT_TTL = 60 * 60 * 24  # counters are recounted from the database at least daily
+RECONCILE_BATCH_SIZE = 500
+
+# ids of the users that have a counter, walked by reconcile_unread_counts
+UNREAD_COUNTED_USERS_KEY = "notifications:unread_counted"
+
+
+def unread_count_key(user_id) -> str:
+    return f"user:{user_id}:notifications_unread"
+
+
+# A counter only moves while it exists: a missing one is seeded from the database on
+# the next read, so applying a delta to it would count that change twice. A counter
+# that would go negative has drifted and is dropped, to be recounted.
+_ADJUST_LUA = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return nil
+end
+local value = redis.call('INCRBY', KEYS[1], ARGV[1])
+if value < 0 then
+    redis.call('DEL', KEYS[1])
+    return nil
+end
+return value
+"""
+
+# Overwrite a counter only if nothing moved it since it was read.
+_COMPARE_AND_SET_LUA = """
+if redis.call('GET', KEYS[1]) ~= ARGV[1] then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+return 1
+"""
+
+_adjust_script = redis.register_script(_ADJUST_LUA)
+_compare_and_set_script = redis.register_script(_COMPARE_AND_SET_LUA)
+
+
+def count_unread_in_db(user_ids) -> dict:
+    """
+    {user id: unread notifications} straight from the database, served by the partial
+    notif_receiver_unread_idx index. Users without unread notifications are left out.
+    """
+    return dict(
+        CommentNotification.objects.filter(receiver_id__in=user_ids, is_read=False)
+        .values("receiver_id")
+        .annotate(count=Count("id"))
+        .order_by()
+        .values_list("receiver_id", "count")
+    )
+
+
+def get_unread_counts(user_ids) -> dict:
+    """
+    {user id: unread notifications} for every id in `user_ids`. Counters missing from
+    Redis are counted in the database and stored; without Redis everything is counted.
+    """
+    user_ids = list(dict.fromkeys(user_ids))
+    if not user_ids:
+        return {}
+    try:
+        cached = redis.mget([unread_count_key(user_id) for user_id in user_ids])
+    except Exception as e:
+        logger.warning("[NOTIFICATION] Failed to read unread counters: %s", str(e))
+        cached = [None] * len(user_ids)
+
+    counts = {user_id: int(value) for user_id, value in zip(user_ids, cached) if value is not None}
+    missing = [user_id for user_id in user_ids if user_id not in counts]
+    if missing:
+        counted = count_unread_in_db(missing)
+        counts.update({user_id: counted.get(user_id, 0) for user_id in missing})
+        _seed_unread_counts({user_id: counts[user_id] for user_id in missing})
+    return counts
+
+
+def get_unread_count(user_id) -> int:
+    return get_unread_counts([user_id])[user_id]
+
+
+def _seed_unread_counts(counts: dict):
+    # NX: a counter seeded by a concurrent reader in the meantime is kept
+    try:
+        pipe = redis.pipeline()
+        for user_id, count in counts.items():
+            pipe.set(unread_count_key(user_id), count, ex=UNREAD_COUNT_TTL, nx=True)
+        pipe.sadd(UNREAD_COUNTED_USERS_KEY, *counts)
+        pipe.execute()
+    except Exception as e:
+        logger.warning("[NOTIFICATION] Failed to store unread counters: %s", str(e))
+
+
+def adjust_unread_count(user_id, delta: int):
+    """
+    Move the user's counter by `delta`. Call it once the change is committed; counters
+    are best effort and never fail the write that triggered them.
+    """
+    if not delta:
+        return
+    try:
+        _adjust_script(keys=[unread_count_key(user_id)], args=[delta])
+    except Exception as e:
+        logger.warning(
+            "[NOTIFICATION] Failed to adjust unread counter - user_id=%s, delta=%s: %s",
+            user_id,
+            delta,
+            str(e),
+        )
+
+
+def reconcile_unread_counts(batch_size: int = RECONCILE_BATCH_SIZE) -> int:
+    """
+    Compare every stored counter with the database and correct the ones that drifted,
+    e.g. through a failed adjustment or a seed that raced a new notification. A counter
+    that changes while it is being checked is left for the next run. Returns the number
+    of counters corrected.
+    """
+    corrected = 0
+    cursor = 0
+    while True:
+        cursor, members = redis.sscan(UNREAD_COUNTED_USERS_KEY, cursor, count=batch_size)
+        if members:
+            corrected += _reconcile_batch([int(member) for member in members])
+        if not cursor:
+            return corrected
+
+
+def _reconcile_batch(user_ids) -> int:
+    # read the counters before counting: a notification committed in between then
+    # shows up as a changed counter, and the compare-and-set skips it
+    stored = redis.mget([unread_count_key(user_id) for user_id in user_ids])
+    counted = count_unread_in_db(user_ids)
+
+    expired = []
+    corrected = 0
+    for user_id, value in zip(user_ids, stored):
+        if value is None:
+            expired.append(user_id)
+            continue
+        actual = counted.get(user_id, 0)
+        if int(value) != actual and _compare_and_set_script(
+            keys=[unread_count_key(user_id)], args=[value, actual, UNREAD_COUNT_TTL]
+        ):
+            corrected += 1
+    if expired:
+        redis.srem(UNREAD_COUNTED_USERS_KEY, *expired)
+    return corrected
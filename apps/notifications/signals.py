@@ -1,12 +1,11 @@
-from asgiref.sync import async_to_sync
-from channels.layers import get_channel_layer
-from django.db import connection
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 from apps.comments.models import Comment
+from apps.notifications.dispatcher import dispatcher
 from apps.notifications.models import CommentNotification
-from apps.notifications.serializers import CommentNotificationReadSerializer
+from apps.notifications.services import adjust_unread_count
 
 
 @receiver(post_save, dispatch_uid="send_comment_notification_unique", sender=Comment)
@@ -34,32 +33,19 @@ def send_comment_notification(sender, instance: Comment, created, **kwargs):
         message=f"{sender_fill_name} replied to you in "
         f"{instance.post.title if instance.post else 'a post'}",
     )
-    with connection.cursor() as cursor:
-        cursor.execute(
-            """
-                       SELECT COUNT(*)
-                       FROM "CommentNotifications"
-                       WHERE receiver_id = %s
-                         AND is_read = FALSE
-                       """,
-            [instance.parent.author_id],
-        )
-        current = cursor.fetchone()[0]
+    # the websocket push is serialized and sent by the dispatcher thread, after commit
+    transaction.on_commit(lambda: dispatcher.enqueue(obj.receiver_id, obj.pk))
 
-    unread_count = current + 1
-    ctx = {"unread_count": unread_count}
 
-    payload = CommentNotificationReadSerializer(obj, context=ctx).data
-    send_realtime_notification(obj.receiver_id, payload)
+@receiver(post_save, dispatch_uid="count_new_unread_notification", sender=CommentNotification)
+def count_new_unread_notification(sender, instance: CommentNotification, created, **kwargs):
+    if created and not instance.is_read:
+        transaction.on_commit(lambda: adjust_unread_count(instance.receiver_id, 1))
 
 
-def send_realtime_notification(receiver_id, payload):
-    channel_layer = get_channel_layer()
-    group_name = f"comment_notification_room_id_{receiver_id}"
-    async_to_sync(channel_layer.group_send)(
-        group_name,
-        {
-            "type": "comment_notification",
-            "payload": payload,
-        },
-    )
+@receiver(
+    post_delete, dispatch_uid="uncount_deleted_unread_notification", sender=CommentNotification
+)
+def uncount_deleted_unread_notification(sender, instance: CommentNotification, **kwargs):
+    if not instance.is_read:
+        transaction.on_commit(lambda: adjust_unread_count(instance.receiver_id, -1))
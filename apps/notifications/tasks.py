@@ -0,0 +1,28 @@
+import logging
+
+from celery import shared_task
+from django.core.cache import cache
+
+from apps.notifications.services.unread_counts import reconcile_unread_counts
+
+logger = logging.getLogger(__name__)
+
+RECONCILE_LOCK_TIMEOUT = 60 * 10
+
+
+@shared_task
+def reconcile_unread_notification_counts():
+    """
+    Correct the Redis unread notification counters that drifted from the database.
+    """
+    if not cache.add("lock:reconcile_unread_notification_counts", 1, RECONCILE_LOCK_TIMEOUT):
+        return "Reconciliation already running."
+
+    try:
+        corrected = reconcile_unread_counts()
+    finally:
+        cache.delete("lock:reconcile_unread_notification_counts")
+
+    if corrected:
+        logger.info("[NOTIFICATION] Unread counters reconciled - corrected=%s", corrected)
+    return f"Corrected {corrected} unread counters."
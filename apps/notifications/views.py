@@ -6,7 +6,7 @@ from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
-from apps.comments.pagination import CommentPageNumberPagination
+from apps.comments.pagination import CommentFeedPagination
 
 from .models import CommentNotification
 from .serializers import (
@@ -14,6 +14,7 @@ from .serializers import (
     DeleteCommentNotificationSerializer,
     MarkAsReadSerializer,
 )
+from .services import get_unread_count
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +22,7 @@ logger = logging.getLogger(__name__)
 @extend_schema(tags=["CommentNotifications"])
 class CommentNotificationViewSet(viewsets.GenericViewSet):
     permission_classes = [IsAuthenticated]
-    pagination_class = CommentPageNumberPagination
+    pagination_class = CommentFeedPagination
 
     def get_queryset(self):
         base_qs = CommentNotification.objects.all().select_related(
@@ -46,10 +47,7 @@ class CommentNotificationViewSet(viewsets.GenericViewSet):
     def inbox(self, request):
         qs = self.get_queryset().filter(receiver=request.user).order_by("-created_at")
 
-        unread_count = CommentNotification.objects.filter(
-            receiver=request.user, is_read=False
-        ).count()
-        ctx = {"unread_count": unread_count}
+        ctx = {"unread_count": get_unread_count(request.user.pk)}
 
         paginated = self.paginate_queryset(qs)
         if paginated is not None:
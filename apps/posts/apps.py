@@ -6,4 +6,8 @@ class PostsConfig(AppConfig):
     name = "apps.posts"
 
     def ready(self):
+        import apps.posts.signals.counters  # noqa
+        import apps.posts.signals.engagement  # noqa
         import apps.posts.signals.invalidation  # noqa
+        import apps.posts.signals.search  # noqa
+        import apps.posts.signals.suggestions  # noqa
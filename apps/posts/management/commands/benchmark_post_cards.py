@@ -0,0 +1,102 @@
+"""
+Management command to benchmark the post card read path against the model path.
+
+Usage:
+    python manage.py benchmark_post_cards
+    python manage.py benchmark_post_cards --page-size 50 --iterations 50
+
+Renders the same page of the newest published posts through both paths and reports
+queries and wall time per page, after checking that both produce identical JSON:
+
+    model  PostListSerializer over Post instances, with the select_related and
+           prefetch_related the list endpoints used before post cards
+    card   PostCardSerializer over post_card_values() rows
+
+Run it against a database with realistic data; timings include query execution,
+serialization and JSON rendering, i.e. what a cache miss of a list endpoint pays.
+"""
+
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.common.utils.encoded_response import render_json
+from apps.posts.models import Post
+from apps.posts.serializers import PostCardSerializer, PostListSerializer
+from apps.posts.services.post_cards import post_card_values
+
+
+def _model_page(page_size):
+    posts = (
+        Post.published.select_related("author", "category")
+        .prefetch_related("images", "allowed_reactions", "comments")
+        .order_by("-published_at", "-pk")[:page_size]
+    )
+    return render_json(PostListSerializer(posts, many=True).data)
+
+
+def _card_page(page_size):
+    rows = post_card_values(Post.published.order_by("-published_at", "-pk"))[:page_size]
+    return render_json(PostCardSerializer(rows, many=True).data)
+
+
+class Command(BaseCommand):
+    help = "Compare the post card projection with the model serializer path for list pages."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--page-size",
+            type=int,
+            default=50,
+            help="Posts per rendered page.",
+        )
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=20,
+            help="Timed renders per path, after one warm-up render.",
+        )
+
+    def handle(self, *args, **options):
+        page_size = options["page_size"]
+        iterations = options["iterations"]
+        if page_size < 1 or iterations < 1:
+            raise CommandError("--page-size and --iterations must be positive.")
+
+        paths = {"model": _model_page, "card": _card_page}
+        rendered = {}
+        queries = {}
+        for name, render in paths.items():
+            with CaptureQueriesContext(connection) as captured:
+                rendered[name] = render(page_size)  # warm-up
+            queries[name] = len(captured)
+
+        if rendered["model"] != rendered["card"]:
+            raise CommandError("Post card output differs from PostListSerializer output.")
+
+        self.stdout.write(
+            f"Pages of up to {page_size} posts ({len(rendered['card'])} bytes), "
+            f"{iterations} iterations"
+        )
+        timings = {}
+        for name, render in paths.items():
+            samples = []
+            for _ in range(iterations):
+                started = time.perf_counter()
+                render(page_size)
+                samples.append((time.perf_counter() - started) * 1000)
+            timings[name] = statistics.median(samples)
+            self.stdout.write(
+                f"{name:>5}: {queries[name]} queries, median {timings[name]:.2f} ms, "
+                f"mean {statistics.mean(samples):.2f} ms, max {max(samples):.2f} ms"
+            )
+
+        if timings["card"]:
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Post cards are {timings['model'] / timings['card']:.1f}x faster (median)."
+                )
+            )
@@ -0,0 +1,99 @@
+"""
+Management command to copy unique post viewers from Redis sets into HyperLogLogs.
+
+Usage:
+    python manage.py migrate_unique_views
+    python manage.py migrate_unique_views --dry-run
+    python manage.py migrate_unique_views --delete
+
+Run it once before switching POST_VIEWS_UNIQUE_BACKEND to "hll" and once more right
+after, to pick up viewers recorded in between (PFADD is idempotent). --delete drops the
+sets afterwards and is refused while the "set" backend is still active.
+
+Per-day shards cannot be rebuilt since sets carry no timestamps; windowed counts start
+from the day the "hll" backend is enabled.
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django_redis import get_redis_connection
+
+from apps.posts.services.post_views import HLL_BACKEND, unique_hll_key
+
+SET_KEY_PATTERN = "post:*:views_unique"
+
+
+class Command(BaseCommand):
+    help = "Convert post:<id>:views_unique sets into HyperLogLogs."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Members read (SSCAN) and added (PFADD) per round trip.",
+        )
+        parser.add_argument(
+            "--delete",
+            action="store_true",
+            help="Delete each set once it has been converted.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report how many sets and members would be converted.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        delete = options["delete"]
+        dry_run = options["dry_run"]
+
+        if delete and getattr(settings, "POST_VIEWS_UNIQUE_BACKEND", "set") != HLL_BACKEND:
+            raise CommandError(
+                "Refusing to delete sets while POST_VIEWS_UNIQUE_BACKEND is not 'hll'."
+            )
+
+        redis = get_redis_connection("default")
+        converted = 0
+        members = 0
+
+        for key in redis.scan_iter(match=SET_KEY_PATTERN, count=batch_size):
+            key = key.decode() if isinstance(key, bytes) else key
+            if redis.type(key) not in (b"set", "set"):
+                continue
+
+            post_id = key.split(":")[1]
+            size = redis.scard(key)
+            if dry_run:
+                self.stdout.write(f"[DRY-RUN] Would convert {key} ({size} members)")
+            else:
+                hll_key = unique_hll_key(post_id)
+                for chunk in self._chunks(redis.sscan_iter(key, count=batch_size), batch_size):
+                    redis.pfadd(hll_key, *chunk)
+                if delete:
+                    redis.delete(key)
+                self.stdout.write(
+                    f"Converted {key}: {size} members -> ~{redis.pfcount(hll_key)} unique"
+                )
+            converted += 1
+            members += size
+
+        if dry_run:
+            self.stdout.write(self.style.SUCCESS("Dry run complete. No changes were made."))
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Sets: {converted}, Members: {members}, Deleted: {delete and not dry_run}"
+            )
+        )
+
+    @staticmethod
+    def _chunks(iterable, size):
+        chunk = []
+        for item in iterable:
+            chunk.append(item)
+            if len(chunk) >= size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
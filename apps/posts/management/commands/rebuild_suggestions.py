@@ -0,0 +1,31 @@
+"""
+Management command to rebuild the typeahead index behind /api/posts/suggest/.
+
+Usage:
+    python manage.py rebuild_suggestions
+    python manage.py rebuild_suggestions --batch-size 500
+
+The index is kept current by signals; rebuild it after deploying the feature, after
+bulk writes that skip signals, or if Redis lost its data (the endpoint also schedules
+a rebuild itself when it finds the index missing).
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.posts.services.suggestions import rebuild_suggestions
+
+
+class Command(BaseCommand):
+    help = "Rebuild the Redis suggestion index from posts, tags, categories and authors."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Entities written to Redis per pipeline round trip.",
+        )
+
+    def handle(self, *args, **options):
+        size = rebuild_suggestions(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Suggestion index rebuilt: {size} terms"))
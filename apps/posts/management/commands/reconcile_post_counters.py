@@ -0,0 +1,77 @@
+"""
+Management command to rebuild the denormalized engagement counters on Post.
+
+Usage:
+    python manage.py reconcile_post_counters
+    python manage.py reconcile_post_counters --dry-run
+    python manage.py reconcile_post_counters --batch-size 500
+
+Run it once after adding the counter columns to backfill existing posts, and
+periodically (or after bulk operations that skip signals, e.g. QuerySet.delete() on
+comments or raw SQL) to repair drift. Counters are recomputed inside the UPDATE itself,
+so engagement written while the command runs is not lost.
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.posts.models import Post
+from apps.posts.services.counters import ENGAGEMENT_COUNTER_FIELDS, expected_counters
+
+
+class Command(BaseCommand):
+    help = "Recompute Post engagement counters from reactions, comments, bookmarks and favourites."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Posts compared per query.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report posts whose counters have drifted.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        dry_run = options["dry_run"]
+
+        expected = expected_counters()
+        checked = 0
+        fixed = 0
+        last_pk = 0
+
+        while True:
+            rows = list(
+                Post.objects.filter(pk__gt=last_pk)
+                .order_by("pk")
+                .annotate(**expected)
+                .values("pk", *ENGAGEMENT_COUNTER_FIELDS, *expected)[:batch_size]
+            )
+            if not rows:
+                break
+            last_pk = rows[-1]["pk"]
+            checked += len(rows)
+
+            drifted = {}
+            for row in rows:
+                for field in ENGAGEMENT_COUNTER_FIELDS:
+                    if row[field] != row[f"expected_{field}"]:
+                        drifted.setdefault(field, []).append(row["pk"])
+                        self.stdout.write(
+                            f"{'[DRY-RUN] ' if dry_run else ''}Post {row['pk']} {field}: "
+                            f"{row[field]} -> {row[f'expected_{field}']}"
+                        )
+
+            if dry_run:
+                fixed += len({pk for pks in drifted.values() for pk in pks})
+                continue
+            for field, pks in drifted.items():
+                Post.objects.filter(pk__in=pks).update(**{field: expected[f"expected_{field}"]})
+            fixed += len({pk for pks in drifted.values() for pk in pks})
+
+        if dry_run:
+            self.stdout.write(self.style.SUCCESS("Dry run complete. No changes were made."))
+        self.stdout.write(self.style.SUCCESS(f"Posts checked: {checked}, drifted: {fixed}"))
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.9 on 2026-10-17 05:02
+
+from django.db import migrations, models
+
+# Same counts as apps.posts.services.counters.expected_counters, kept up to date from
+# then on by apps.posts.signals.counters
+BACKFILL_ENGAGEMENT_COUNTERS = """
+UPDATE "Posts" AS p SET
+    reactions_count = (SELECT COUNT(*) FROM "Reactions" r WHERE r.post_id = p.id),
+    comments_count = (
+        SELECT COUNT(*) FROM "Comments" c WHERE c.post_id = p.id AND NOT c.is_deleted
+    ),
+    bookmarks_count = (SELECT COUNT(*) FROM "Bookmarks" b WHERE b.post_id = p.id),
+    favourites_count = (SELECT COUNT(*) FROM "Favourites" f WHERE f.post_id = p.id);
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookmarks', '0001_initial'),
+        ('comments', '0001_initial'),
+        ('favourites', '0001_initial'),
+        ('posts', '0012_add_trgm_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='bookmarks_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='comments_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='favourites_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='reactions_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunSQL(BACKFILL_ENGAGEMENT_COUNTERS, migrations.RunSQL.noop),
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 5.2.9 on 2026-10-17 03:23
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.operations
+from django.conf import settings
+from django.db import migrations, models
+
+# Same document as apps.posts.services.search_document, kept in sync from then on by
+# apps.posts.signals.search
+BACKFILL_SEARCH_DOCUMENT = """
+UPDATE "Posts" AS p SET search_document = concat_ws(
+    ' ',
+    p.title,
+    p.slug,
+    p.short_description,
+    (SELECT concat_ws(' ', u.first_name, u.last_name) FROM "Users" u WHERE u.id = p.author_id),
+    (SELECT c.name FROM "Categories" c WHERE c.id = p.category_id),
+    (
+        SELECT string_agg(t.name, ' ')
+        FROM "Posts_tags" pt JOIN "Tags" t ON t.id = pt.tag_id
+        WHERE pt.post_id = p.id
+    ),
+    p.text_content
+);
+"""
+
+
+class Migration(migrations.Migration):
+    # indexes are built and dropped concurrently so writes to Posts are not blocked
+    atomic = False
+
+    dependencies = [
+        ("categories", "0002_alter_category_options_alter_category_table"),
+        ("posts", "0014_post_search_vector"),
+        ("tags", "0002_alter_tag_options_tag_tags_name_66f2c4_idx_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="search_document",
+            field=models.TextField(blank=True, default="", editable=False),
+        ),
+        migrations.RunSQL(BACKFILL_SEARCH_DOCUMENT, migrations.RunSQL.noop),
+        django.contrib.postgres.operations.AddIndexConcurrently(
+            model_name="post",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_document"],
+                name="post_search_doc_trgm_gin",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+        # the per-column trigram indexes from 0012 are superseded by the one above
+        django.contrib.postgres.operations.RemoveIndexConcurrently(
+            model_name="post",
+            name="post_title_trgm_gin",
+        ),
+        django.contrib.postgres.operations.RemoveIndexConcurrently(
+            model_name="post",
+            name="post_shdesc_trgm_gin",
+        ),
+        django.contrib.postgres.operations.RemoveIndexConcurrently(
+            model_name="post",
+            name="post_text_trgm_gin",
+        ),
+        django.contrib.postgres.operations.RemoveIndexConcurrently(
+            model_name="post",
+            name="post_slug_trgm_gin",
+        ),
+    ]
@@ -1 +1,2 @@
-from .published_posts import PublishedPostManager
\ No newline at end of file
+from .posts import PostManager
+from .published_posts import PublishedPostManager
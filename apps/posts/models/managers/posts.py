@@ -0,0 +1,7 @@
+from django.db.models import Manager
+
+
+class PostManager(Manager):
+    def get_queryset(self):
+        # search documents are only needed in WHERE/ORDER BY, never worth loading
+        return super().get_queryset().defer("search_vector", "search_document")
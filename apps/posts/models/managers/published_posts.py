@@ -1,7 +1,7 @@
-from django.db.models import Manager
+from .posts import PostManager
 
 
-class PublishedPostManager(Manager):
+class PublishedPostManager(PostManager):
     def get_queryset(self):
         from apps.posts.models import Post
 
@@ -1,3 +1,5 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.core.cache import cache
 from django.db import IntegrityError, models
 
@@ -10,7 +12,7 @@ from apps.tags.models import Tag
 from apps.users.models import User
 from core.storages import PublicMediaStorage
 
-from .managers import PublishedPostManager
+from .managers import PostManager, PublishedPostManager
 from .reactions import ReactionType
 
 
@@ -46,8 +48,39 @@ class Post(BaseModel):
     tags = models.ManyToManyField(Tag, blank=True, related_name="posts")
     allow_comments = models.BooleanField(default=True)
 
+    # Denormalized engagement counters, kept up to date by signals.counters with F()
+    # updates and never written by save(). Rebuild with `manage.py reconcile_post_counters`.
+    ENGAGEMENT_COUNTER_FIELDS = (
+        "reactions_count",
+        "comments_count",
+        "bookmarks_count",
+        "favourites_count",
+    )
+    reactions_count = models.PositiveIntegerField(default=0, editable=False)
+    comments_count = models.PositiveIntegerField(default=0, editable=False)
+    bookmarks_count = models.PositiveIntegerField(default=0, editable=False)
+    favourites_count = models.PositiveIntegerField(default=0, editable=False)
+
+    # Full-text search document, recomputed by PostgreSQL on every insert/update of the
+    # source columns and matched through the GIN index below (see trigram_search, mode=fts)
+    SEARCH_CONFIG = "english"
+    search_vector = models.GeneratedField(
+        expression=(
+            SearchVector("title", weight="A", config=SEARCH_CONFIG)
+            + SearchVector("short_description", weight="B", config=SEARCH_CONFIG)
+            + SearchVector("text_content", weight="C", config=SEARCH_CONFIG)
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    # Title, slug, description, author, category, tag names and text in one column, so
+    # trigram search needs a single gin_trgm_ops index. Maintained by signals.search
+    # through services.search_document, never written by save().
+    search_document = models.TextField(default="", blank=True, editable=False)
+
     published = PublishedPostManager()
-    objects = models.Manager()
+    objects = PostManager()
 
     class Meta:
         ordering = ["-created_at"]
@@ -55,12 +88,27 @@ class Post(BaseModel):
             models.Index(fields=["status", "published_at"]),
             models.Index(fields=["status", "created_at"]),
             models.Index(fields=["slug"]),
+            GinIndex(fields=["search_vector"], name="post_search_vector_gin"),
+            GinIndex(
+                fields=["search_document"],
+                name="post_search_doc_trgm_gin",
+                opclasses=["gin_trgm_ops"],
+            ),
         ]
         db_table = "Posts"
         verbose_name = "Post"
         verbose_name_plural = "Posts"
 
     def save(self, *args, **kwargs):
+        if not self._state.adding and not args and kwargs.get("update_fields") is None:
+            # a stale in-memory copy must not overwrite columns maintained by signals
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.name not in self.ENGAGEMENT_COUNTER_FIELDS
+                and field.name != "search_document"
+            ]
         if self.content:
             self.text_content = extract_text_from_json_content(self.content)
         if not self.slug:
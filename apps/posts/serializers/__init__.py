@@ -1,10 +1,12 @@
 from .posts import (
     PostListSerializer,
     PostDetailSerializer,
-    PostWriteSerializer
+    PostWriteSerializer,
+    PostCardSerializer,
+    PostSuggestionSerializer,
 )
 from .reactions import (
     ReactionTypeSerializer,
     ReactionPutSerializer,
     PostReactionsSerializer
-)
\ No newline at end of file
+)
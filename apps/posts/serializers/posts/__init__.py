@@ -2,4 +2,6 @@ from .posts import (
     PostListSerializer,
     PostDetailSerializer,
     PostWriteSerializer
-)
\ No newline at end of file
+)
+from .cards import PostCardSerializer
+from .suggestions import PostSuggestionSerializer
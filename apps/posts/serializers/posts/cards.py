@@ -0,0 +1,87 @@
+from rest_framework import serializers
+
+from apps.posts.models import Post
+
+from .posts import AuthorSerializer
+
+_cover_image_storage = Post._meta.get_field("cover_image").storage
+
+
+class PostCardSerializer(serializers.Serializer):
+    """
+    Read-only post card rendered straight from a `.values()` row of `source_fields`
+    (see services.post_cards.post_card_values): the same output as PostListSerializer,
+    without building Post and User instances or running a field object per value.
+
+    `prefix` reads the row of a related post, e.g. "post__" for a Bookmark row, where
+    the card is declared with source="*".
+    """
+
+    source_fields = (
+        "id",
+        "title",
+        "slug",
+        "short_description",
+        "cover_image",
+        "created_at",
+        "updated_at",
+        "published_at",
+        "status",
+        *Post.ENGAGEMENT_COUNTER_FIELDS,
+        "author_id",
+        "author__first_name",
+        "author__last_name",
+        "author__email",
+    )
+
+    id = serializers.IntegerField(read_only=True)
+    title = serializers.CharField(read_only=True)
+    slug = serializers.SlugField(read_only=True)
+    short_description = serializers.CharField(read_only=True)
+    cover_image = serializers.ImageField(read_only=True)
+    created_at = serializers.DateTimeField(read_only=True)
+    updated_at = serializers.DateTimeField(read_only=True)
+    author = AuthorSerializer(read_only=True)
+    published_at = serializers.DateTimeField(read_only=True)
+    status = serializers.ChoiceField(choices=Post.Status.choices, read_only=True)
+    reactions_count = serializers.IntegerField(read_only=True)
+    comments_count = serializers.IntegerField(read_only=True)
+    bookmarks_count = serializers.IntegerField(read_only=True)
+    favourites_count = serializers.IntegerField(read_only=True)
+
+    def __init__(self, *args, prefix: str = "", **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prefix = prefix
+
+    def _cover_image_url(self, name):
+        if not name:
+            return None
+        url = _cover_image_storage.url(name)
+        request = self.context.get("request")
+        return request.build_absolute_uri(url) if request else url
+
+    def to_representation(self, row):
+        p = self.prefix
+        datetime_field = self.fields["created_at"]
+        first_name = row[f"{p}author__first_name"]
+        last_name = row[f"{p}author__last_name"]
+        email = row[f"{p}author__email"]
+        return {
+            "id": row[f"{p}id"],
+            "title": row[f"{p}title"],
+            "slug": row[f"{p}slug"],
+            "short_description": row[f"{p}short_description"],
+            "cover_image": self._cover_image_url(row[f"{p}cover_image"]),
+            "created_at": datetime_field.to_representation(row[f"{p}created_at"]),
+            "updated_at": datetime_field.to_representation(row[f"{p}updated_at"]),
+            "author": {
+                "id": row[f"{p}author_id"],
+                "first_name": first_name,
+                "last_name": last_name,
+                "full_name": f"{first_name} {last_name}".strip() or email,
+                "email": email,
+            },
+            "published_at": datetime_field.to_representation(row[f"{p}published_at"]),
+            "status": row[f"{p}status"],
+            **{field: row[f"{p}{field}"] for field in Post.ENGAGEMENT_COUNTER_FIELDS},
+        }
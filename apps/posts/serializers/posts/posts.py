@@ -43,6 +43,7 @@ class PostListSerializer(serializers.ModelSerializer):
             "author",
             "published_at",
             "status",
+            *Post.ENGAGEMENT_COUNTER_FIELDS,
         ]
 
     def get_cover_image(self, obj: Post):
@@ -80,6 +81,7 @@ class PostDetailSerializer(serializers.ModelSerializer):
             "tags",
             "allow_comments",
             "read_time",
+            *Post.ENGAGEMENT_COUNTER_FIELDS,
         ]
 
     def get_cover_image(self, obj: Post):
@@ -0,0 +1,10 @@
+from rest_framework import serializers
+
+from apps.posts.services.suggestions import KINDS
+
+
+class PostSuggestionSerializer(serializers.Serializer):
+    type = serializers.ChoiceField(choices=KINDS)
+    id = serializers.IntegerField()
+    label = serializers.CharField()
+    slug = serializers.CharField(allow_null=True, help_text="Set for posts and tags")
@@ -1 +1 @@
-from .post_views import register_post_view, get_post_views
+from .post_views import get_post_unique_views_window, get_post_views, register_post_view
@@ -0,0 +1,49 @@
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+
+from apps.posts.models import Post
+
+ENGAGEMENT_COUNTER_FIELDS = Post.ENGAGEMENT_COUNTER_FIELDS
+
+
+def adjust_counter(post_id, field: str, delta: int):
+    """
+    Atomically add `delta` to a post's engagement counter in the current transaction.
+    A plain UPDATE, so Post signals, updated_at and cache invalidation are not touched.
+    """
+    if post_id is None:
+        return
+    Post.objects.filter(pk=post_id).update(**{field: Greatest(F(field) + delta, Value(0))})
+
+
+def _count_subquery(model, **filters):
+    return Coalesce(
+        Subquery(
+            model.objects.filter(post=OuterRef("pk"), **filters)
+            .order_by()
+            .values("post")
+            .annotate(count=Count("pk"))
+            .values("count"),
+            output_field=IntegerField(),
+        ),
+        0,
+    )
+
+
+def expected_counters():
+    """
+    Annotations computing every engagement counter from the source tables, named
+    expected_<field>.
+    """
+    from apps.bookmarks.models import Bookmark
+    from apps.comments.models import Comment
+    from apps.favourites.models import Favourite
+    from apps.posts.models import Reaction
+
+    return {
+        "expected_reactions_count": _count_subquery(Reaction),
+        # deleted comments are soft deleted, only live ones count
+        "expected_comments_count": _count_subquery(Comment, is_deleted=False),
+        "expected_bookmarks_count": _count_subquery(Bookmark),
+        "expected_favourites_count": _count_subquery(Favourite),
+    }
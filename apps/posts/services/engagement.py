@@ -0,0 +1,86 @@
+import logging
+import time
+
+from django.utils import timezone
+from django_redis import get_redis_connection
+
+from apps.posts.services.leaderboards import DAY_BUCKET_TTL, leaderboard_key
+from apps.posts.services.trending import TRENDING_EPOCH_KEY, TRENDING_HALF_LIFE, TRENDING_KEY
+
+logger = logging.getLogger(__name__)
+
+redis = get_redis_connection("default")
+
+ENGAGEMENT_WEIGHTS = {
+    "view": 1.0,
+    "reaction": 3.0,
+    "bookmark": 4.0,
+    "favourite": 4.0,
+    "comment": 5.0,
+}
+
+# Updates the trending ranking and the popularity leaderboards in one round trip.
+#
+# Trending uses forward decay: instead of decaying every score over time, new events
+# are weighted by 2^((now - epoch) / half_life), which ranks exactly like decaying all
+# older scores. The epoch is read inside the script so increments stay consistent with
+# rebase_trending. Leaderboards get the plain weight.
+_RECORD_LUA = """
+local epoch = tonumber(redis.call('GET', KEYS[2]))
+if not epoch then
+    epoch = tonumber(ARGV[3])
+    redis.call('SET', KEYS[2], ARGV[3])
+end
+local increment = tonumber(ARGV[2]) * 2 ^ ((tonumber(ARGV[3]) - epoch) / tonumber(ARGV[4]))
+redis.call('ZINCRBY', KEYS[1], increment, ARGV[1])
+
+for i = 3, #KEYS do
+    redis.call('ZINCRBY', KEYS[i], ARGV[2], ARGV[1])
+end
+redis.call('EXPIRE', KEYS[3], ARGV[5])
+return 1
+"""
+
+_record_script = redis.register_script(_RECORD_LUA)
+
+
+def record_engagement(post_id: int, event: str):
+    """
+    Add an engagement `event` (see ENGAGEMENT_WEIGHTS) to the post's trending score and
+    popularity leaderboards. Removals (unbookmarking, deleting a reaction, ...) are not
+    subtracted: both rankings measure activity, not current state.
+    """
+    keys = [
+        TRENDING_KEY,
+        TRENDING_EPOCH_KEY,
+        leaderboard_key("day", timezone.localdate()),  # must stay third, gets the TTL
+        leaderboard_key("week"),
+        leaderboard_key("month"),
+        leaderboard_key("all"),
+    ]
+    _record_script(
+        keys=keys,
+        args=[
+            post_id,
+            ENGAGEMENT_WEIGHTS[event],
+            time.time(),
+            TRENDING_HALF_LIFE,
+            int(DAY_BUCKET_TTL.total_seconds()),
+        ],
+    )
+
+
+def safe_record_engagement(post_id: int, event: str):
+    """
+    record_engagement for signal handlers: rankings are best effort and must never fail
+    the write that triggered them.
+    """
+    try:
+        record_engagement(post_id, event)
+    except Exception as e:
+        logger.warning(
+            "[TRENDING] Failed to record engagement - post_id=%s, event=%s: %s",
+            post_id,
+            event,
+            str(e),
+        )
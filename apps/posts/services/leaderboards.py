@@ -0,0 +1,60 @@
+from datetime import timedelta
+
+from django.utils import timezone
+from django_redis import get_redis_connection
+
+redis = get_redis_connection("default")
+
+# Undecayed engagement totals. Every event is added to today's bucket and to the
+# running week, month and all-time boards; the rollover task rebuilds week and month
+# from the day buckets once a day so that days leaving the window drop out.
+WINDOW_DAYS = {"day": 1, "week": 7, "month": 30}
+WINDOWS = (*WINDOW_DAYS, "all")
+DAY_BUCKET_TTL = timedelta(days=WINDOW_DAYS["month"] + 2)
+
+
+def day_bucket_key(day) -> str:
+    return f"popular:day:{day:%Y%m%d}"
+
+
+def leaderboard_key(window: str, day=None) -> str:
+    if window == "day":
+        return day_bucket_key(day or timezone.localdate())
+    return f"popular:{window}"
+
+
+def _day_buckets(days: int, today=None) -> list:
+    today = today or timezone.localdate()
+    return [day_bucket_key(today - timedelta(days=n)) for n in range(days)]
+
+
+def rollover_leaderboards(windows=("week", "month")):
+    """
+    Rebuild multi-day boards from their day buckets with ZUNIONSTORE (replaces the
+    destination atomically); nothing is recomputed from the database.
+    """
+    today = timezone.localdate()
+    pipe = redis.pipeline()
+    for window in windows:
+        pipe.zunionstore(leaderboard_key(window), _day_buckets(WINDOW_DAYS[window], today))
+    pipe.execute()
+
+
+def get_popular_post_ids(window: str, limit: int) -> list:
+    """
+    Top `limit` post ids of a leaderboard window, best first. O(log N + limit).
+    """
+    key = leaderboard_key(window)
+    if window in ("week", "month") and not redis.exists(key):
+        # first use or after a Redis flush
+        rollover_leaderboards([window])
+    return [int(post_id) for post_id in redis.zrevrange(key, 0, limit - 1)]
+
+
+def remove_from_leaderboards(post_id: int):
+    pipe = redis.pipeline()
+    for key in (leaderboard_key("week"), leaderboard_key("month"), leaderboard_key("all")):
+        pipe.zrem(key, post_id)
+    for key in _day_buckets(WINDOW_DAYS["month"] + 1):
+        pipe.zrem(key, post_id)
+    pipe.execute()
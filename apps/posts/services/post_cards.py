@@ -0,0 +1,58 @@
+from django.core.cache import cache
+
+from apps.common.utils.encoded_response import render_json
+from apps.posts.models import Post
+from apps.posts.serializers import PostCardSerializer
+
+POST_CARD_TIMEOUT = 60 * 60  # 1 hour
+
+
+def post_card_fields(prefix: str = "") -> list:
+    """
+    Columns a PostCardSerializer row needs, e.g. prefix="post__" from a Bookmark.
+    """
+    return [prefix + field for field in PostCardSerializer.source_fields]
+
+
+def post_card_values(queryset):
+    """
+    `queryset` of posts projected to PostCardSerializer rows: one query joining the
+    author, instead of Post and User instances carrying the whole content.
+    """
+    return queryset.select_related(None).prefetch_related(None).values(*post_card_fields())
+
+
+def post_card_key(post_id) -> str:
+    return f"post_card:{post_id}"
+
+
+def get_post_cards(post_ids, context=None) -> dict:
+    """
+    Encoded PostCardSerializer output of published posts, keyed by post id.
+    Cached cards are fetched with one get_many; misses are built with one query and
+    stored with one set_many. Ids of unpublished or missing posts are left out.
+    """
+    post_ids = list(dict.fromkeys(post_ids))
+    if not post_ids:
+        return {}
+
+    cached = cache.get_many([post_card_key(post_id) for post_id in post_ids])
+    cards = {}
+    for post_id in post_ids:
+        card = cached.get(post_card_key(post_id))
+        if card is not None:
+            cards[post_id] = card
+
+    missing = [post_id for post_id in post_ids if post_id not in cards]
+    if missing:
+        rows = post_card_values(Post.published.filter(pk__in=missing))
+        built = {
+            row["id"]: render_json(PostCardSerializer(row, context=context or {}).data)
+            for row in rows
+        }
+        cache.set_many(
+            {post_card_key(post_id): card for post_id, card in built.items()},
+            POST_CARD_TIMEOUT,
+        )
+        cards.update(built)
+    return cards
@@ -0,0 +1,57 @@
+import hashlib
+import math
+
+from apps.posts.models import Post
+from apps.posts.trigram_search import (
+    FTS_MODE,
+    full_text_matches,
+    trigram_matches,
+    word_similarity_threshold,
+)
+from apps.posts.utils.cache_keys import get_or_compute_list
+
+SEARCH_CACHE_TIMEOUT = 60 * 5  # 5 minutes, unless a post changes first
+SEARCH_RESULTS_LIMIT = 1000  # best hits kept per query; results stop at this depth
+MIN_SIM_STEP = 0.05  # min_sim values within one step share a cache entry
+
+
+def min_sim_bucket(min_sim: float) -> float:
+    """
+    Lower edge of the bucket `min_sim` falls in. Hits cached for the lower edge are a
+    superset of the hits for any threshold in the bucket.
+    """
+    return round(math.floor(round(min_sim / MIN_SIM_STEP, 6)) * MIN_SIM_STEP, 2)
+
+
+def _ranked_hits(queryset) -> list:
+    hits = queryset.order_by("-score", "-published_at").values_list("pk", "score")
+    return [[post_id, score] for post_id, score in hits[:SEARCH_RESULTS_LIMIT]]
+
+
+def get_search_hits(mode: str, query: str, min_sim: float) -> list:
+    """
+    Ordered [post_id, score] pairs for an already normalized `query`, best first.
+
+    Hits cover posts of every status so that all users, filters and pages of a query
+    share one computation; callers narrow them down to what the requester may see.
+    Trigram hits are computed for min_sim's bucket, callers drop scores below their
+    exact threshold. Entries live under the list generation, so any post change
+    invalidates them.
+    """
+    digest = hashlib.blake2b(query.encode(), digest_size=16).hexdigest()
+    if mode == FTS_MODE:
+        suffix = f"fts:{digest}"
+
+        def compute():
+            return _ranked_hits(full_text_matches(Post.objects.all(), query))
+
+    else:
+        bucket = min_sim_bucket(min_sim)
+        suffix = f"trigram:{bucket}:{digest}"
+
+        def compute():
+            # evaluated inside the block, which sets the threshold `%>` prunes by
+            with word_similarity_threshold(bucket):
+                return _ranked_hits(trigram_matches(Post.objects.all(), query, bucket))
+
+    return get_or_compute_list("search", suffix, compute, SEARCH_CACHE_TIMEOUT)
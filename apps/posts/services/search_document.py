@@ -0,0 +1,51 @@
+from django.contrib.postgres.aggregates import StringAgg
+from django.db import connection
+from django.db.models import F, Func, OuterRef, Subquery, TextField, Value
+
+from apps.categories.models import Category
+from apps.posts.models import Post
+from apps.users.models import User
+
+
+def _concat_ws(*expressions):
+    # NULL parts are skipped instead of blanking the whole document
+    return Func(Value(" "), *expressions, function="CONCAT_WS", output_field=TextField())
+
+
+def _search_document():
+    """
+    Post.search_document built in SQL from the post row, its author, category and tag
+    names. Mirrors the backfill in posts migration 0015.
+    """
+    author = (
+        User.objects.filter(pk=OuterRef("author_id"))
+        .annotate(full_name=_concat_ws("first_name", "last_name"))
+        .values("full_name")
+    )
+    category = Category.objects.filter(pk=OuterRef("category_id")).values("name")
+    tags = (
+        Post.tags.through.objects.filter(post=OuterRef("pk"))
+        .order_by()
+        .values("post")
+        .annotate(names=StringAgg("tag__name", " "))
+        .values("names")
+    )
+    return _concat_ws(
+        F("title"),
+        F("slug"),
+        F("short_description"),
+        Subquery(author),
+        Subquery(category),
+        Subquery(tags),
+        F("text_content"),
+    )
+
+
+def refresh_search_documents(queryset):
+    """
+    Rebuild search_document for every post in `queryset` with a single UPDATE.
+    Only maintained on PostgreSQL, the only backend that searches it.
+    """
+    if connection.vendor != "postgresql":
+        return 0
+    return queryset.update(search_document=_search_document())
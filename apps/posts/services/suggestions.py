@@ -0,0 +1,186 @@
+import logging
+
+from django_redis import get_redis_connection
+
+from apps.categories.models import Category
+from apps.posts.models import Post
+from apps.posts.trigram_search import normalize_query
+from apps.tags.models import Tag
+from apps.users.models import User
+
+logger = logging.getLogger(__name__)
+
+redis = get_redis_connection("default")
+
+# Typeahead index: one ZSET where every member has score 0, so ZRANGEBYLEX walks the
+# members in byte order and a prefix lookup is a single O(log N + k) range read.
+# Member: "<term>\0<kind>\0<id>\0<position>\0<label>\0<slug>", where <term> is the
+# normalized label starting at word <position>, so "dj" also finds "Intro to Django".
+SUGGEST_KEY = "suggest:terms"
+SUGGEST_REBUILD_KEY = "suggest:terms:rebuild"
+SUGGEST_MAX_WORDS = 8  # word positions indexed per label
+SUGGEST_MAX_TERM_LENGTH = 64
+# Members read per lookup before ranking and deduplication. The range is read in byte
+# order, not rank order, so this is the window the ranking sees, see suggest().
+SUGGEST_SCAN_LIMIT = 1000
+
+POST, TAG, CATEGORY, AUTHOR = "post", "tag", "category", "author"
+KINDS = (POST, TAG, CATEGORY, AUTHOR)  # ties are ranked in this order
+
+_SEPARATOR = "\0"
+
+# Swaps the members of one entity: drops the ones recorded in its set, adds the new ones.
+_REPLACE_LUA = """
+local old = redis.call('SMEMBERS', KEYS[2])
+for i = 1, #old do
+    redis.call('ZREM', KEYS[1], old[i])
+end
+redis.call('DEL', KEYS[2])
+for i = 1, #ARGV do
+    redis.call('ZADD', KEYS[1], 0, ARGV[i])
+    redis.call('SADD', KEYS[2], ARGV[i])
+end
+return #ARGV
+"""
+
+_replace_script = redis.register_script(_REPLACE_LUA)
+
+
+def entity_key(kind: str, pk) -> str:
+    return f"suggest:entity:{kind}:{pk}"
+
+
+def _members(kind: str, pk, label: str, slug: str = "") -> list:
+    label = label.replace(_SEPARATOR, "")
+    words = normalize_query(label).split(" ")
+    if not words[0]:
+        return []
+    members = []
+    for position in range(min(len(words), SUGGEST_MAX_WORDS)):
+        term = " ".join(words[position:])[:SUGGEST_MAX_TERM_LENGTH]
+        members.append(_SEPARATOR.join([term, kind, str(pk), str(position), label, slug or ""]))
+    return members
+
+
+def _author_label(user) -> str:
+    return " ".join(filter(None, [user.first_name, user.last_name]))
+
+
+def _load(kind: str, pk):
+    """
+    Label and slug of an entity that belongs in the index, or None.
+    """
+    if kind == POST:
+        post = Post.published.filter(pk=pk).values("title", "slug").first()
+        return post and (post["title"], post["slug"])
+    if kind == TAG:
+        tag = Tag.objects.filter(pk=pk).values("name", "slug").first()
+        return tag and (tag["name"], tag["slug"])
+    if kind == CATEGORY:
+        category = Category.objects.filter(pk=pk).values("name").first()
+        return category and (category["name"], "")
+    if kind == AUTHOR:
+        # only authors readers can find posts of
+        user = User.objects.filter(pk=pk, posts__status=Post.Status.PUBLISHED).first()
+        return user and (_author_label(user), "")
+    raise ValueError(f"Unknown suggestion kind: {kind}")
+
+
+def sync_suggestion(kind: str, pk):
+    """
+    Bring one entity's index entries in line with the database: (re)index it, or drop
+    it if it was deleted or should not be suggested (e.g. an unpublished post).
+    """
+    loaded = _load(kind, pk)
+    members = _members(kind, pk, *loaded) if loaded else []
+    _replace_script(keys=[SUGGEST_KEY, entity_key(kind, pk)], args=members)
+
+
+def safe_sync_suggestion(kind: str, pk):
+    """
+    sync_suggestion for signal handlers: the index is best effort and must never fail
+    the write that triggered it.
+    """
+    try:
+        sync_suggestion(kind, pk)
+    except Exception as e:
+        logger.warning("[SUGGEST] Failed to sync suggestion - kind=%s, id=%s: %s", kind, pk, str(e))
+
+
+def _all_entities():
+    posts = Post.published.values_list("pk", "title", "slug")
+    yield from ((POST, pk, title, slug) for pk, title, slug in posts.iterator())
+    for pk, name, slug in Tag.objects.values_list("pk", "name", "slug").iterator():
+        yield TAG, pk, name, slug
+    for pk, name in Category.objects.values_list("pk", "name").iterator():
+        yield CATEGORY, pk, name, ""
+    authors = User.objects.filter(posts__status=Post.Status.PUBLISHED).distinct()
+    for user in authors.iterator():
+        yield AUTHOR, user.pk, _author_label(user), ""
+
+
+def rebuild_suggestions(batch_size: int = 1000) -> int:
+    """
+    Rebuild the whole index from the database into a scratch key and swap it in with
+    RENAME, so lookups never see a partial index. Returns the number of members.
+    Entity changes synced while the rebuild runs are picked up by the next one.
+    """
+    redis.delete(SUGGEST_REBUILD_KEY)
+    pipe = redis.pipeline(transaction=False)
+    total = 0
+    for index, (kind, pk, label, slug) in enumerate(_all_entities(), start=1):
+        members = _members(kind, pk, label, slug)
+        pipe.delete(entity_key(kind, pk))
+        if members:
+            pipe.zadd(SUGGEST_REBUILD_KEY, {member: 0 for member in members})
+            pipe.sadd(entity_key(kind, pk), *members)
+            total += len(members)
+        if index % batch_size == 0:
+            pipe.execute()
+    pipe.execute()
+
+    if total:
+        redis.rename(SUGGEST_REBUILD_KEY, SUGGEST_KEY)
+    else:
+        redis.delete(SUGGEST_KEY)
+    return total
+
+
+def suggest(prefix: str, limit: int) -> list:
+    """
+    Up to `limit` suggestions whose label has a word starting with `prefix`. Labels
+    matching from their first word come first, then posts, tags, categories and
+    authors, then shorter labels.
+
+    Only the first SUGGEST_SCAN_LIMIT index members of the prefix range are ranked, and
+    the range is alphabetical: for a short prefix matching more members than that, a
+    better ranked label further down the alphabet is not suggested until the prefix
+    gets longer. Typing narrows the range quickly, so this only affects the first one
+    or two characters on large indexes.
+    """
+    prefix = normalize_query(prefix)[:SUGGEST_MAX_TERM_LENGTH]
+    if not prefix:
+        return []
+
+    encoded = prefix.encode()
+    members = redis.zrangebylex(
+        SUGGEST_KEY, b"[" + encoded, b"[" + encoded + b"\xff", start=0, num=SUGGEST_SCAN_LIMIT
+    )
+
+    best = {}
+    for member in members:
+        _, kind, pk, position, label, slug = member.decode().split(_SEPARATOR)
+        rank = (int(position) > 0, KINDS.index(kind), len(label), label)
+        entry = best.get((kind, pk))
+        if entry is None or rank < entry[0]:
+            best[(kind, pk)] = (
+                rank,
+                {"type": kind, "id": int(pk), "label": label, "slug": slug or None},
+            )
+
+    ranked = sorted(best.values(), key=lambda entry: entry[0])
+    return [suggestion for _, suggestion in ranked[:limit]]
+
+
+def suggestions_ready() -> bool:
+    return bool(redis.exists(SUGGEST_KEY))
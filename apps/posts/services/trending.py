@@ -0,0 +1,50 @@
+import time
+
+from django_redis import get_redis_connection
+
+redis = get_redis_connection("default")
+
+# Time-decayed engagement ranking, fed by services.engagement.record_engagement
+TRENDING_KEY = "trending:posts"
+TRENDING_EPOCH_KEY = "trending:epoch"
+TRENDING_HALF_LIFE = 60 * 60 * 24  # seconds; an engagement loses half its weight per day
+TRENDING_MAX_SIZE = 10_000  # posts kept in the ranking after each rebase
+TRENDING_MIN_SCORE = 0.01  # roughly a single view seven half-lives ago
+
+# Moves the epoch to now by scaling every score down by the elapsed decay, so scores
+# stay far from float overflow, then drops the tail of the ranking.
+_REBASE_LUA = """
+local epoch = tonumber(redis.call('GET', KEYS[2]))
+if not epoch then
+    return 0
+end
+local factor = 2 ^ (-(tonumber(ARGV[1]) - epoch) / tonumber(ARGV[2]))
+redis.call('ZUNIONSTORE', KEYS[1], 1, KEYS[1], 'WEIGHTS', factor)
+redis.call('SET', KEYS[2], ARGV[1])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', '(' .. ARGV[4])
+redis.call('ZREMRANGEBYRANK', KEYS[1], 0, -tonumber(ARGV[3]) - 1)
+return redis.call('ZCARD', KEYS[1])
+"""
+
+_rebase_script = redis.register_script(_REBASE_LUA)
+
+
+def remove_from_trending(post_id: int):
+    redis.zrem(TRENDING_KEY, post_id)
+
+
+def get_trending_post_ids(limit: int) -> list:
+    """
+    Top `limit` post ids by decayed engagement, best first, with one ZREVRANGE.
+    """
+    return [int(post_id) for post_id in redis.zrevrange(TRENDING_KEY, 0, limit - 1)]
+
+
+def rebase_trending() -> int:
+    """
+    Renormalize scores to the current time and trim the ranking. Returns its size.
+    """
+    return _rebase_script(
+        keys=[TRENDING_KEY, TRENDING_EPOCH_KEY],
+        args=[time.time(), TRENDING_HALF_LIFE, TRENDING_MAX_SIZE, TRENDING_MIN_SCORE],
+    )
@@ -0,0 +1,54 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.posts.models import Reaction
+from apps.posts.services.counters import adjust_counter
+
+# Each handler runs inside the transaction of the write that triggered it, so a rolled
+# back create/delete rolls the counter change back too. Comments are soft deleted,
+# see Comment.soft_delete.
+
+
+@receiver(post_save, sender=Reaction)
+def reaction_created(sender, instance, created, **kwargs):
+    if created:
+        adjust_counter(instance.post_id, "reactions_count", 1)
+
+
+@receiver(post_delete, sender=Reaction)
+def reaction_deleted(sender, instance, **kwargs):
+    adjust_counter(instance.post_id, "reactions_count", -1)
+
+
+@receiver(post_save, sender="comments.Comment")
+def comment_created(sender, instance, created, **kwargs):
+    if created and not instance.is_deleted:
+        adjust_counter(instance.post_id, "comments_count", 1)
+
+
+@receiver(post_delete, sender="comments.Comment")
+def comment_deleted(sender, instance, **kwargs):
+    if not instance.is_deleted:
+        adjust_counter(instance.post_id, "comments_count", -1)
+
+
+@receiver(post_save, sender="bookmarks.Bookmark")
+def bookmark_created(sender, instance, created, **kwargs):
+    if created:
+        adjust_counter(instance.post_id, "bookmarks_count", 1)
+
+
+@receiver(post_delete, sender="bookmarks.Bookmark")
+def bookmark_deleted(sender, instance, **kwargs):
+    adjust_counter(instance.post_id, "bookmarks_count", -1)
+
+
+@receiver(post_save, sender="favourites.Favourite")
+def favourite_created(sender, instance, created, **kwargs):
+    if created:
+        adjust_counter(instance.post_id, "favourites_count", 1)
+
+
+@receiver(post_delete, sender="favourites.Favourite")
+def favourite_deleted(sender, instance, **kwargs):
+    adjust_counter(instance.post_id, "favourites_count", -1)
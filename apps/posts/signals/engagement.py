@@ -0,0 +1,66 @@
+import logging
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.posts.models import Post, Reaction
+from apps.posts.services.engagement import safe_record_engagement
+from apps.posts.services.leaderboards import remove_from_leaderboards
+from apps.posts.services.trending import remove_from_trending
+
+logger = logging.getLogger(__name__)
+
+
+@receiver(post_save, sender=Reaction)
+def reaction_engagement(sender, instance, created, **kwargs):
+    if created:
+        safe_record_engagement(instance.post_id, "reaction")
+
+
+@receiver(post_save, sender="comments.Comment")
+def comment_engagement(sender, instance, created, **kwargs):
+    if created and instance.post_id:
+        safe_record_engagement(instance.post_id, "comment")
+
+
+@receiver(post_save, sender="bookmarks.Bookmark")
+def bookmark_engagement(sender, instance, created, **kwargs):
+    if created:
+        safe_record_engagement(instance.post_id, "bookmark")
+
+
+@receiver(post_save, sender="favourites.Favourite")
+def favourite_engagement(sender, instance, created, **kwargs):
+    if created:
+        safe_record_engagement(instance.post_id, "favourite")
+
+
+@receiver(post_save, sender=Post)
+def post_unpublished(sender, instance, **kwargs):
+    """
+    Only published posts can trend.
+    """
+    if instance.status != Post.Status.PUBLISHED:
+        try:
+            remove_from_trending(instance.pk)
+        except Exception as e:
+            logger.warning(
+                "[TRENDING] Failed to remove post from ranking - post_id=%s: %s",
+                instance.pk,
+                str(e),
+            )
+
+
+@receiver(post_delete, sender=Post)
+def post_removed(sender, instance, **kwargs):
+    """
+    Unpublished posts keep their leaderboard scores (they are filtered out when read
+    and come back if republished); deleted ones are dropped everywhere.
+    """
+    try:
+        remove_from_trending(instance.pk)
+        remove_from_leaderboards(instance.pk)
+    except Exception as e:
+        logger.warning(
+            "[TRENDING] Failed to remove post from ranking - post_id=%s: %s", instance.pk, str(e)
+        )
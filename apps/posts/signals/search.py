@@ -0,0 +1,84 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from apps.categories.models import Category
+from apps.posts.models import Post
+from apps.posts.services.search_document import refresh_search_documents
+from apps.tags.models import Tag
+from apps.users.models import User
+
+AUTHOR_NAME_FIELDS = {"first_name", "last_name"}
+
+
+# Every handler rebuilds the affected documents with one UPDATE in the transaction of
+# the triggering write. Deleting a category or tag detaches its posts without signals,
+# so their ids are collected in pre_delete and refreshed in post_delete.
+
+
+def _remember_posts(instance, queryset):
+    instance._search_document_post_ids = list(queryset.values_list("pk", flat=True))
+
+
+def _refresh_remembered_posts(instance):
+    post_ids = getattr(instance, "_search_document_post_ids", None)
+    if post_ids:
+        refresh_search_documents(Post.objects.filter(pk__in=post_ids))
+
+
+@receiver(post_save, sender=Post)
+def post_saved(sender, instance, **kwargs):
+    refresh_search_documents(Post.objects.filter(pk=instance.pk))
+
+
+@receiver(m2m_changed, sender=Post.tags.through)
+def post_tags_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if not reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            refresh_search_documents(Post.objects.filter(pk=instance.pk))
+    elif action == "pre_clear":
+        # tag.posts.clear() does not report which posts lost the tag
+        _remember_posts(instance, instance.posts.all())
+    elif action == "post_clear":
+        _refresh_remembered_posts(instance)
+    elif action in ("post_add", "post_remove"):
+        refresh_search_documents(Post.objects.filter(pk__in=pk_set))
+
+
+@receiver(post_save, sender=User)
+def author_saved(sender, instance, created, update_fields=None, **kwargs):
+    # most user saves (logins, profile flags) do not touch the name
+    if created or (update_fields is not None and not AUTHOR_NAME_FIELDS & set(update_fields)):
+        return
+    refresh_search_documents(Post.objects.filter(author=instance))
+
+
+@receiver(post_save, sender=Category)
+def category_saved(sender, instance, created, **kwargs):
+    if not created:
+        refresh_search_documents(Post.objects.filter(category=instance))
+
+
+@receiver(pre_delete, sender=Category)
+def category_deleting(sender, instance, **kwargs):
+    _remember_posts(instance, Post.objects.filter(category=instance))
+
+
+@receiver(post_delete, sender=Category)
+def category_deleted(sender, instance, **kwargs):
+    _refresh_remembered_posts(instance)
+
+
+@receiver(post_save, sender=Tag)
+def tag_saved(sender, instance, created, **kwargs):
+    if not created:
+        refresh_search_documents(Post.objects.filter(tags=instance))
+
+
+@receiver(pre_delete, sender=Tag)
+def tag_deleting(sender, instance, **kwargs):
+    _remember_posts(instance, Post.objects.filter(tags=instance))
+
+
+@receiver(post_delete, sender=Tag)
+def tag_deleted(sender, instance, **kwargs):
+    _refresh_remembered_posts(instance)
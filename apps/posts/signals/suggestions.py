@@ -0,0 +1,59 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.categories.models import Category
+from apps.posts.models import Post
+from apps.posts.services.suggestions import (
+    AUTHOR,
+    CATEGORY,
+    POST,
+    TAG,
+    safe_sync_suggestion,
+)
+from apps.tags.models import Tag
+from apps.users.models import User
+
+from .search import AUTHOR_NAME_FIELDS
+
+# The index is synced from the committed database state, so rolled back writes never
+# reach it and the order in which handlers run does not matter.
+
+
+def _sync_on_commit(kind, pk):
+    if pk is not None:
+        transaction.on_commit(partial(safe_sync_suggestion, kind, pk))
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+def post_changed(sender, instance, **kwargs):
+    _sync_on_commit(POST, instance.pk)
+    # publishing or removing a post may add or remove its author
+    _sync_on_commit(AUTHOR, instance.author_id)
+
+
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+def tag_changed(sender, instance, **kwargs):
+    _sync_on_commit(TAG, instance.pk)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def category_changed(sender, instance, **kwargs):
+    _sync_on_commit(CATEGORY, instance.pk)
+
+
+@receiver(post_save, sender=User)
+def author_saved(sender, instance, created, update_fields=None, **kwargs):
+    if created or (update_fields is not None and not AUTHOR_NAME_FIELDS & set(update_fields)):
+        return
+    _sync_on_commit(AUTHOR, instance.pk)
+
+
+@receiver(post_delete, sender=User)
+def author_deleted(sender, instance, **kwargs):
+    _sync_on_commit(AUTHOR, instance.pk)
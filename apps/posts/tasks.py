@@ -1,8 +1,15 @@
 import logging
 
 from celery import shared_task
+from django.core.cache import cache
+from django.http import Http404
 from django.utils import timezone
 
+from apps.common.utils.cache import compute_and_store
+from apps.posts.services.leaderboards import rollover_leaderboards
+from apps.posts.services.suggestions import AUTHOR, POST, rebuild_suggestions, safe_sync_suggestion
+from apps.posts.services.trending import rebase_trending
+
 from .models import Post
 
 logger = logging.getLogger(__name__)
@@ -17,12 +24,70 @@ def publish_scheduled_posts():
         published_at__lte=now,
     )
     try:
-        count = posts.update(status=Post.Status.PUBLISHED)
+        published = list(posts.values_list("pk", "author_id"))
+        count = posts.filter(pk__in=[pk for pk, _ in published]).update(
+            status=Post.Status.PUBLISHED
+        )
     except Exception as e:
         logger.error(e)
         return "Error occurred while publishing scheduled posts."
 
+    # update() sends no signals, index the newly published posts here
+    for post_id, _ in published:
+        safe_sync_suggestion(POST, post_id)
+    for author_id in {author_id for _, author_id in published}:
+        safe_sync_suggestion(AUTHOR, author_id)
+
     if count > 0:
         logger.info("Published %d scheduled posts.", count)
 
     return f"Published {count} posts."
+
+
+@shared_task
+def refresh_client_post_cache(action, cache_key, timeout, stale_ttl, request_snapshot, kwargs):
+    """
+    Rebuild a stale ClientPostViewSet cache entry outside of the request cycle.
+    """
+    from apps.posts.views import ClientPostViewSet
+
+    view = ClientPostViewSet.for_background(action, request_snapshot, kwargs)
+    try:
+        compute_and_store(cache_key, view.build_payload, timeout, stale_ttl)
+    except Http404:
+        # post was deleted or is no longer visible, let the next request decide
+        cache.delete(cache_key)
+        return f"Dropped {cache_key}."
+
+    logger.debug("[CACHE] Refreshed in background - key=%s", cache_key)
+    return f"Refreshed {cache_key}."
+
+
+@shared_task
+def rebase_trending_scores():
+    """
+    Keep trending scores bounded, see services.trending.rebase_trending.
+    """
+    size = rebase_trending()
+    logger.info("[TRENDING] Trending scores rebased - size=%s", size)
+    return f"Trending ranking holds {size} posts."
+
+
+@shared_task
+def rollover_popularity_leaderboards():
+    """
+    Rebuild the week and month leaderboards from day buckets after the date changes.
+    """
+    rollover_leaderboards()
+    logger.info("[TRENDING] Popularity leaderboards rolled over")
+    return "Rolled over week and month leaderboards."
+
+
+@shared_task
+def rebuild_suggestion_index():
+    """
+    Rebuild the typeahead index from the database, see services.suggestions.
+    """
+    size = rebuild_suggestions()
+    logger.info("[SUGGEST] Suggestion index rebuilt - members=%s", size)
+    return f"Suggestion index holds {size} terms."
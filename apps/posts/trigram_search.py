@@ -1,88 +1,198 @@
-from django.contrib.postgres.search import TrigramSimilarity
-from django.db import connection
-from django.db.models import F, Max, OuterRef, Q, Subquery
-from django.db.models.functions import Greatest
+import math
+from contextlib import contextmanager
+
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.lookups import TrigramWordSimilar
+from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramWordSimilarity
+from django.db import connection, transaction
+from django.db.models import BigIntegerField, F, Func, IntegerField, Q, Value
+from django.db.models.functions import Cast
 from rest_framework.filters import BaseFilterBackend
 
-DEFAULT_THRESHOLD = 0.15  # tuneable; 0.1-0.3 typical
+# word similarity of the query to the closest stretch of Post.search_document;
+# tuneable, PostgreSQL's own default is PG_TRGM_WORD_THRESHOLD
+DEFAULT_THRESHOLD = 0.3
+PG_TRGM_WORD_THRESHOLD = "0.6"
+
+TRIGRAM_MODE = "trigram"
+FTS_MODE = "fts"
+SEARCH_MODES = (TRIGRAM_MODE, FTS_MODE)
+
+
+def normalize_query(q) -> str:
+    """
+    Case-folded search term with whitespace collapsed; both search modes ignore case
+    and spacing, so equivalent spellings share cached results.
+    """
+    return " ".join((q or "").casefold().split())
+
+
+@contextmanager
+def word_similarity_threshold(min_sim):
+    """
+    Runs the block in a transaction with pg_trgm.word_similarity_threshold set to
+    `min_sim`. `%>` compares against this setting, which is what lets the GIN index
+    prune rows. The setting is transaction-local, so it never reaches other queries on
+    a persistent connection; inside an outer transaction the previous value is put back
+    when the block ends.
+
+    Until pg_trgm is loaded into the backend the setting does not exist yet; it then
+    reads as NULL (missing_ok) and is restored to pg_trgm's default.
+    """
+    nested = connection.in_atomic_block
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT current_setting('pg_trgm.word_similarity_threshold', true), "
+                "set_config('pg_trgm.word_similarity_threshold', %s, true)",
+                [str(min_sim)],
+            )
+            previous = cursor.fetchone()[0]
+        yield
+        if nested:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT set_config('pg_trgm.word_similarity_threshold', %s, true)",
+                    [previous or PG_TRGM_WORD_THRESHOLD],
+                )
+
+
+def trigram_matches(queryset, q, min_sim):
+    """
+    Posts whose search_document contains a stretch with word similarity >= `min_sim`
+    to `q`, annotated with that similarity as `score`.
+
+    Evaluate it inside word_similarity_threshold(min_sim): with another threshold in
+    effect `%>` prunes by that one. The explicit bound below only guards against a
+    lower one.
+    """
+    return (
+        queryset.filter(TrigramWordSimilar(F("search_document"), q))
+        .annotate(score=TrigramWordSimilarity(q, "search_document"))
+        .filter(score__gte=min_sim)
+    )
+
+
+def full_text_matches(queryset, q):
+    """
+    Posts whose search_vector matches `q` in websearch syntax, annotated with their
+    ts_rank_cd as `score`.
+    """
+    query = SearchQuery(q, search_type="websearch", config=queryset.model.SEARCH_CONFIG)
+    return queryset.filter(search_vector=query).annotate(
+        score=SearchRank(F("search_vector"), query, cover_density=True)
+    )
 
 
 class TrigramSearchFilter(BaseFilterBackend):
     """
     If ?q=... is provided:
-     - On PostgreSQL: annotate similarity across multiple fields using TrigramSimilarity,
-       filter by threshold (query param `min_sim`) and order by similarity desc.
+     - On PostgreSQL with ?mode=trigram (default): match Post.search_document (title,
+       slug, description, author, category, tags and text) with the `%>` word similarity
+       operator through its gin_trgm_ops index, filter by threshold (query param
+       `min_sim`) and order by similarity desc. One pass, no joins.
+     - On PostgreSQL with ?mode=fts: match Post.search_vector through its GIN index with
+       websearch_to_tsquery (quoted phrases, OR, -exclusions) and order by ts_rank_cd.
+       Covers title, short_description and text_content only; typos do not match.
      - On other DBs: fallback to OR'd icontains over the same fields.
+
+    On PostgreSQL the ranked post ids come from services.search_cache, shared by every
+    user and page of the same normalized query; visibility and the other filters are
+    applied to them here.
     """
 
     search_param = "q"
     min_sim_param = "min_sim"
+    mode_param = "mode"
 
-    def filter_queryset(self, request, queryset, view):
-        q = request.query_params.get(self.search_param)
-        if not q:
-            return queryset
+    @classmethod
+    def get_mode(cls, query_params) -> str:
+        mode = query_params.get(cls.mode_param, "").strip().lower()
+        return mode if mode in SEARCH_MODES else TRIGRAM_MODE
 
+    @classmethod
+    def get_min_sim(cls, query_params) -> float:
         # Allow caller to set a custom minimum similarity (float)
         try:
-            min_sim = float(request.query_params.get(self.min_sim_param, DEFAULT_THRESHOLD))
+            min_sim = float(query_params.get(cls.min_sim_param, DEFAULT_THRESHOLD))
         except (TypeError, ValueError):
-            min_sim = DEFAULT_THRESHOLD
+            return DEFAULT_THRESHOLD
+        if not math.isfinite(min_sim):
+            return DEFAULT_THRESHOLD
+        return min(max(min_sim, 0.0), 1.0)
+
+    def filter_queryset(self, request, queryset, view):
+        q = normalize_query(request.query_params.get(self.search_param))
+        if not q:
+            return queryset
 
         if connection.vendor == "postgresql":
-            # annotate similarity across fields and take the greatest value
-            # use fields you asked for: title, short_description, text_content, slug,
-            # author first/last, category name, tags name
-            # Because tags is m2m, distinct() below removes duplicates.
-            base = queryset.annotate(
-                sim_title=TrigramSimilarity("title", q),
-                sim_short=TrigramSimilarity("short_description", q),
-                sim_text=TrigramSimilarity("text_content", q),
-                sim_slug=TrigramSimilarity("slug", q),
-                sim_author_first=TrigramSimilarity("author__first_name", q),
-                sim_author_last=TrigramSimilarity("author__last_name", q),
-                sim_category=TrigramSimilarity("category__name", q),
-                sim_tag=TrigramSimilarity("tags__name", q),
-            ).annotate(
-                similarity=Greatest(
-                    F("sim_title"),
-                    F("sim_short"),
-                    F("sim_text"),
-                    F("sim_slug"),
-                    F("sim_author_first"),
-                    F("sim_author_last"),
-                    F("sim_category"),
-                    F("sim_tag"),
-                )
-            )
-            max_sim_subquery = (
-                base.filter(pk=OuterRef("pk"))
-                .values("pk")
-                .annotate(max_sim=Max("similarity"))
-                .values("max_sim")
-            )
+            return self.ranked_search(request, queryset, q)
 
-            qs = queryset.annotate(similarity=Subquery(max_sim_subquery)).filter(
-                similarity__gte=min_sim
-            )
+        # Non-Postgres fallback: cheap partial match across the same fields.
+        lookups = (
+            Q(title__icontains=q)
+            | Q(short_description__icontains=q)
+            | Q(text_content__icontains=q)
+            | Q(slug__icontains=q)
+            | Q(author__first_name__icontains=q)
+            | Q(author__last_name__icontains=q)
+            | Q(category__name__icontains=q)
+            | Q(tags__name__icontains=q)
+        )
+        return queryset.filter(lookups).distinct()
+
+    def ranked_search(self, request, queryset, q):
+        # imported here: search_cache builds on the list cache helpers, which import us
+        from apps.posts.services.search_cache import get_search_hits
 
-            # user ordering OR default fallback
-            ordering = request.query_params.get("ordering")
-            if ordering:
-                return qs.order_by(ordering)
-
-            return qs.order_by("-similarity", "-published_at")
-
-        else:
-            # Non-Postgres fallback: cheap partial match across the same fields.
-            lookups = (
-                Q(title__icontains=q)
-                | Q(short_description__icontains=q)
-                | Q(text_content__icontains=q)
-                | Q(slug__icontains=q)
-                | Q(author__first_name__icontains=q)
-                | Q(author__last_name__icontains=q)
-                | Q(category__name__icontains=q)
-                | Q(tags__name__icontains=q)
+        mode = self.get_mode(request.query_params)
+        min_sim = self.get_min_sim(request.query_params)
+        post_ids = [
+            post_id
+            for post_id, score in get_search_hits(mode, q, min_sim)
+            if mode == FTS_MODE or score >= min_sim
+        ]
+        if not post_ids:
+            return queryset.none()
+
+        qs = queryset.filter(pk__in=post_ids).annotate(
+            search_position=Func(
+                Cast(Value(post_ids), ArrayField(BigIntegerField())),
+                F("pk"),
+                function="array_position",
+                output_field=IntegerField(),
             )
-            return queryset.filter(lookups).distinct()
+        )
+
+        # user ordering OR default fallback
+        ordering = request.query_params.get("ordering")
+        if ordering:
+            return qs.order_by(ordering)
+
+        return qs.order_by("search_position")
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.search_param,
+                "required": False,
+                "in": "query",
+                "description": "Search term",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.mode_param,
+                "required": False,
+                "in": "query",
+                "description": "Search mode: fuzzy trigram matching or full-text search",
+                "schema": {"type": "string", "enum": list(SEARCH_MODES), "default": TRIGRAM_MODE},
+            },
+            {
+                "name": self.min_sim_param,
+                "required": False,
+                "in": "query",
+                "description": "Minimum trigram similarity (trigram mode only)",
+                "schema": {"type": "number", "default": DEFAULT_THRESHOLD},
+            },
+        ]
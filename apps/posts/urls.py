@@ -4,11 +4,12 @@ from rest_framework_nested.routers import NestedDefaultRouter
 
 from apps.comments.views import CommentViewSet
 
-from .views import AuthorPostViewSet, ClientPostViewSet
+from .views import AuthorPostViewSet, ClientPostViewSet, PostSuggestViewSet
 
 router = DefaultRouter()
 router.register("author", AuthorPostViewSet, basename="author")
 router.register("client", ClientPostViewSet, basename="client")
+router.register("suggest", PostSuggestViewSet, basename="suggest")
 
 client_router = NestedDefaultRouter(router, "client", lookup="post")
 client_router.register("comments", CommentViewSet, basename="client-comments")
@@ -0,0 +1,265 @@
+import hashlib
+import logging
+from urllib.parse import urlencode, urlsplit, urlunsplit
+
+from django.core.cache import cache
+from django.http import QueryDict
+from django_filters.filters import BaseCSVFilter
+from rest_framework.filters import OrderingFilter
+
+try:
+    from django_redis import get_redis_connection  # type: ignore
+except Exception:
+    get_redis_connection = None  # not on django-redis backend
+
+from apps.common.utils.cache import get_or_compute, is_django_redis
+from apps.common.utils.local_cache import local_get_or_set
+from apps.posts.trigram_search import (
+    DEFAULT_THRESHOLD,
+    TRIGRAM_MODE,
+    TrigramSearchFilter,
+    normalize_query,
+)
+
+logger = logging.getLogger(__name__)
+
+# Part of every post cache key, list keys included. Bump it whenever the format of the
+# cached values changes: entries written by the previous release are then never read,
+# only expired.
+#   2: values wrapped in get_or_compute envelopes
+#   3: encoded response payloads (body, ETag, gzip variant) instead of serializer data
+POST_CACHE_VERSION = 3
+
+
+def post_detail_key(slug: str) -> str:
+    return f"post_detail:v{POST_CACHE_VERSION}:{slug}"
+
+
+def related_posts_key(slug: str) -> str:
+    return f"related_posts:v{POST_CACHE_VERSION}:{slug}"
+
+
+def post_tags_key(slug: str) -> str:
+    return f"post_tags:v{POST_CACHE_VERSION}:{slug}"
+
+
+def post_reactions_key(slug: str, user_id="*") -> str:
+    """
+    Reactions of the post as seen by `user_id` ("anon" for anonymous users); the
+    default "*" gives the pattern matching every user's entry.
+    """
+    return f"post_reactions:v{POST_CACHE_VERSION}:{slug}:{user_id}"
+
+
+# Every list-style cache key (post_list, latest_posts, trending_posts, ...) embeds this
+# counter. Invalidation bumps it, so old entries become unreachable and expire via TTL.
+LIST_GENERATION_KEY = "post_list:generation"
+
+# Reads the current generation and the entry stored under it in a single round trip.
+_GET_VERSIONED_LUA = """
+local generation = redis.call('GET', KEYS[1]) or '0'
+return {generation, redis.call('GET', ARGV[1] .. generation .. ARGV[2])}
+"""
+
+_get_versioned_script = None
+
+
+def _list_key_prefix(namespace: str) -> str:
+    return f"{namespace}:v{POST_CACHE_VERSION}:g"
+
+
+def list_cache_key(namespace: str, generation: int, suffix: str) -> str:
+    return f"{_list_key_prefix(namespace)}{generation}:{suffix}"
+
+
+def get_list_generation() -> int:
+    return int(cache.get(LIST_GENERATION_KEY) or 0)
+
+
+def bump_list_generation() -> int:
+    """
+    Atomically move every list cache to a fresh namespace.
+    """
+    if is_django_redis():
+        client = get_redis_connection("default")
+        return client.incr(cache.make_key(LIST_GENERATION_KEY))
+
+    cache.add(LIST_GENERATION_KEY, 0, None)
+    return cache.incr(LIST_GENERATION_KEY)
+
+
+def get_list_cache(namespace: str, suffix: str):
+    """
+    Returns (generation, cached_entry) for a versioned list cache entry.
+    The caller must store fresh values under the returned generation.
+    """
+    global _get_versioned_script
+
+    if is_django_redis():
+        try:
+            if _get_versioned_script is None:
+                client = get_redis_connection("default")
+                _get_versioned_script = client.register_script(_GET_VERSIONED_LUA)
+
+            generation, value = _get_versioned_script(
+                keys=[cache.make_key(LIST_GENERATION_KEY)],
+                args=[cache.make_key(_list_key_prefix(namespace)), f":{suffix}"],
+            )
+            if value is not None:
+                value = cache.client.decode(value)
+            return int(generation), value
+        except Exception as e:
+            logger.warning("[CACHE] Versioned lookup failed, falling back: %s", str(e))
+
+    generation = get_list_generation()
+    return generation, cache.get(list_cache_key(namespace, generation, suffix))
+
+
+# Local (per-process) list keys carry no generation so a hit needs no Redis round trip;
+# a generation bump evicts all of them through this prefix instead.
+LOCAL_LIST_KEYS = "list:*"
+
+
+def local_list_key(namespace: str, suffix: str) -> str:
+    return f"list:{namespace}:{suffix}"
+
+
+def get_or_compute_list(
+    namespace: str,
+    suffix: str,
+    compute,
+    timeout: int,
+    *,
+    local: bool = False,
+    **options,
+):
+    """
+    Single-flight read of a versioned list cache entry, see get_or_compute.
+    With `local`, hits are served from the per-process cache without touching Redis.
+    """
+
+    def from_redis():
+        generation, envelope = get_list_cache(namespace, suffix)
+        key = list_cache_key(namespace, generation, suffix)
+        return get_or_compute(key, compute, timeout, envelope=envelope, **options)
+
+    if local:
+        return local_get_or_set(local_list_key(namespace, suffix), from_redis)
+    return from_redis()
+
+
+def _filterset_params(filterset_class, query_params) -> dict:
+    params = {}
+    for name, filter_ in filterset_class.base_filters.items():
+        widget = filter_.field.widget
+        suffixes = getattr(widget, "suffixes", None)
+        names = [widget.suffixed(name, suffix) for suffix in suffixes] if suffixes else [name]
+
+        for param in names:
+            value = query_params.get(param, "").strip()
+            if value and isinstance(filter_, BaseCSVFilter):
+                # ?tags=b,a,a and ?tags=a,b select the same posts
+                value = ",".join(sorted({v.strip() for v in value.split(",") if v.strip()}))
+            if value:
+                params[param] = value
+    return params
+
+
+def _search_params(backend, query_params) -> dict:
+    q = normalize_query(query_params.get(backend.search_param))
+    if not q:
+        return {}
+
+    params = {backend.search_param: q}
+    mode = backend.get_mode(query_params)
+    if mode != TRIGRAM_MODE:
+        # min_sim only applies to trigram matching
+        params[backend.mode_param] = mode
+        return params
+
+    min_sim = backend.get_min_sim(query_params)
+    if min_sim != DEFAULT_THRESHOLD:
+        params[backend.min_sim_param] = repr(min_sim)
+    return params
+
+
+def _ordering_params(backend, query_params) -> dict:
+    ordering = query_params.get(backend.ordering_param, "")
+    terms = [term.strip() for term in ordering.split(",") if term.strip()]
+    return {backend.ordering_param: ",".join(terms)} if terms else {}
+
+
+def _pagination_params(paginator, query_params) -> dict:
+    params = {}
+
+    keyset_requested = getattr(paginator, "keyset_requested", None)
+    if keyset_requested and keyset_requested(query_params):
+        params[paginator.keyset_mode_query_param] = paginator.keyset_mode
+        cursor = query_params.get(paginator.cursor_query_param)
+        if cursor:
+            params[paginator.cursor_query_param] = cursor
+    else:
+        page = query_params.get(paginator.page_query_param, "").strip()
+        try:
+            page = str(int(page))
+        except ValueError:
+            pass
+        if page and page != "1":
+            params[paginator.page_query_param] = page
+
+    page_size = paginator.page_size
+    if paginator.page_size_query_param:
+        try:
+            page_size = int(query_params[paginator.page_size_query_param])
+            if page_size <= 0:
+                page_size = paginator.page_size
+            elif paginator.max_page_size:
+                page_size = min(page_size, paginator.max_page_size)
+        except (KeyError, ValueError):
+            pass
+    if page_size != paginator.page_size:
+        params[paginator.page_size_query_param] = str(page_size)
+    return params
+
+
+def canonical_list_params(query_params, view) -> dict:
+    """
+    The list query reduced to the parameters which change the result: recognized
+    filter, search, ordering and pagination params. Multi-value params are sorted,
+    defaults, empty and unknown params are dropped.
+    """
+    params = {}
+    if getattr(view, "filterset_class", None):
+        params.update(_filterset_params(view.filterset_class, query_params))
+
+    for backend in view.filter_backends:
+        if issubclass(backend, TrigramSearchFilter):
+            params.update(_search_params(backend, query_params))
+        elif issubclass(backend, OrderingFilter):
+            params.update(_ordering_params(backend, query_params))
+
+    if view.paginator is not None:
+        params.update(_pagination_params(view.paginator, query_params))
+    return params
+
+
+def canonical_list_query(query_params, view) -> str:
+    """
+    Fixed-length digest of canonical_list_params: requests that only differ in
+    parameters which do not change the result share it.
+    """
+    canonical = urlencode(sorted(canonical_list_params(query_params, view).items()))
+    return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+
+
+def canonical_list_link(url, view):
+    """
+    `url` (e.g. a pagination link) with its query reduced to canonical_list_params.
+    Cached list bodies are shared by every request with the same canonical query, so
+    the links in them must not carry the other params of whoever built the entry.
+    """
+    if url is None:
+        return None
+    parts = urlsplit(url)
+    params = canonical_list_params(QueryDict(parts.query), view)
+    return urlunsplit(parts._replace(query=urlencode(sorted(params.items()))))
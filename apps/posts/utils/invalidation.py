@@ -2,7 +2,15 @@ import logging
 
 from django.core.cache import cache
 
-from apps.users.models.user import Role
+from apps.common.utils.local_cache import publish_invalidation
+from apps.posts.utils.cache_keys import (
+    LOCAL_LIST_KEYS,
+    bump_list_generation,
+    post_detail_key,
+    post_reactions_key,
+    post_tags_key,
+    related_posts_key,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -13,13 +21,15 @@ def invalidate_post_cache(post):
     Call this when a post is created, updated, or deleted.
     """
     cache_keys = [
-        f"post_detail:{post.slug}",
-        f"related_posts:{post.slug}",
-        f"post_tags:{post.slug}",
-        f"post_reactions:{post.slug}:anon",
+        post_detail_key(post.slug),
+        related_posts_key(post.slug),
+        post_tags_key(post.slug),
+        post_reactions_key(post.slug, "anon"),
+        f"post_card:{post.pk}",
     ]
 
     cache.delete_many(cache_keys)
+    publish_invalidation(*cache_keys)
     logger.info(
         "[CACHE] Post cache invalidated - post_id=%s, slug=%s, keys=%s",
         post.pk,
@@ -32,41 +42,17 @@ def invalidate_post_list_caches():
     """
     Invalidate all list-based caches.
     Call this when any post is created, updated, deleted, or published.
-    """
-    roles = ["anon", Role.ADMIN, Role.AUTHOR]
-    cache_keys = []
-
-    for role in roles:
-        cache_keys.extend(
-            [
-                f"latest_posts:{role}",
-                f"trending_posts:{role}",
-                f"most_popular_posts:{role}",
-            ]
-        )
 
-    cache_keys.append("homepage_statistics")
-    cache.delete_many(cache_keys)
-    logger.info("[CACHE] Post list caches invalidated - keys=%s", cache_keys)
-    # Clear all list caches with filters (pattern-based deletion)
-    # Note: This requires Redis backend
+    List keys (post_list, latest, trending, popular, homepage statistics) live under a
+    shared generation number, so a single INCR retires all of them at once. Entries of
+    older generations are never read again and age out through their TTL.
+    """
     try:
-        from django_redis import get_redis_connection
-
-        redis_conn = get_redis_connection("default")
-
-        # Delete all post_list cache keys
-        keys = redis_conn.keys("post_list:*")
-        if keys:
-            deleted_count = redis_conn.delete(*keys)
-            logger.info(
-                "[CACHE] Post list pattern caches invalidated - pattern=post_list:*, count=%s",
-                deleted_count,
-            )
+        generation = bump_list_generation()
+        publish_invalidation(LOCAL_LIST_KEYS)
+        logger.info("[CACHE] Post list caches invalidated - generation=%s", generation)
     except Exception as e:
-        # Fallback if Redis not available
-        logger.warning("[CACHE] Failed to invalidate pattern caches: %s", str(e))
-        pass
+        logger.warning("[CACHE] Failed to bump post list generation: %s", str(e))
 
 
 def invalidate_reaction_cache(post, user_id=None):
@@ -75,7 +61,7 @@ def invalidate_reaction_cache(post, user_id=None):
     If user_id provided, invalidates only that user's cache.
     """
     if user_id:
-        cache_key = f"post_reactions:{post.slug}:{user_id}"
+        cache_key = post_reactions_key(post.slug, user_id)
         cache.delete(cache_key)
         logger.info(
             "[CACHE] Reaction cache invalidated - post_id=%s, slug=%s, user_id=%s, key=%s",
@@ -86,7 +72,7 @@ def invalidate_reaction_cache(post, user_id=None):
         )
     else:
         # Invalidate for all users (when reaction counts change)
-        cache.delete(f"post_reactions:{post.slug}:anon")
+        cache.delete(post_reactions_key(post.slug, "anon"))
         logger.info(
             "[CACHE] Reaction cache invalidated (anon) - post_id=%s, slug=%s",
             post.pk,
@@ -98,15 +84,16 @@ def invalidate_reaction_cache(post, user_id=None):
             from django_redis import get_redis_connection
 
             redis_conn = get_redis_connection("default")
-            keys = redis_conn.keys(f"post_reactions:{post.slug}:*")
+            pattern = post_reactions_key(post.slug)
+            keys = redis_conn.keys(pattern)
             if keys:
                 deleted_count = redis_conn.delete(*keys)
                 logger.info(
                     "[CACHE] Reaction pattern caches invalidated - post_id=%s, slug=%s,"
-                    " pattern=post_reactions:%s:*, count=%s",
+                    " pattern=%s, count=%s",
                     post.pk,
                     post.slug,
-                    post.slug,
+                    pattern,
                     deleted_count,
                 )
         except Exception as e:
@@ -119,23 +106,5 @@ def invalidate_category_cache(category_id):
     Invalidate caches for posts in a specific category.
     Call this when a category is updated or deleted.
     """
-    try:
-        from django_redis import get_redis_connection
-
-        redis_conn = get_redis_connection("default")
-
-        # Delete all list caches that might include this category
-        keys = redis_conn.keys("post_list:*")
-        if keys:
-            deleted_count = redis_conn.delete(*keys)
-            logger.info(
-                "[CACHE] Category cache invalidated - category_id=%s, pattern=post_list:*, "
-                "count=%s",
-                category_id,
-                deleted_count,
-            )
-    except Exception as e:
-        logger.warning("[CACHE] Failed to invalidate category caches: %s", str(e))
-        pass
-
+    logger.info("[CACHE] Category cache invalidated - category_id=%s", category_id)
     invalidate_post_list_caches()
@@ -1,2 +1,3 @@
 from .author import AuthorPostViewSet
-from .client import ClientPostViewSet
\ No newline at end of file
+from .client import ClientPostViewSet
+from .suggest import PostSuggestViewSet
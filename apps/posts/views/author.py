@@ -1,6 +1,7 @@
 import logging
 
-from drf_spectacular.utils import extend_schema
+from django.conf import settings
+from drf_spectacular.utils import OpenApiParameter, extend_schema
 from rest_framework.decorators import action
 from rest_framework.parsers import MultiPartParser
 from rest_framework.response import Response
@@ -14,6 +15,7 @@ from apps.posts.serializers import (
     PostWriteSerializer,
     ReactionTypeSerializer,
 )
+from apps.posts.services import get_post_unique_views_window, get_post_views
 
 logger = logging.getLogger(__name__)
 
@@ -95,6 +97,37 @@ class AuthorPostViewSet(ModelViewSet):
         ser = PostListSerializer(page or qs, many=True)
         return self.get_paginated_response(ser.data) if page is not None else Response(ser.data)
 
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                "days",
+                int,
+                description=(
+                    "Also count unique viewers over the last `days` days, at most "
+                    "POST_VIEWS_DAILY_RETENTION_DAYS. Needs the HyperLogLog views backend."
+                ),
+            ),
+        ],
+    )
+    @action(methods=["get"], detail=True, url_path="views")
+    def view_stats(self, request, slug=None):
+        post = self.get_object()
+        total, unique = get_post_views(post.pk)
+        data = {"views_total": total, "views_unique": unique}
+
+        days = request.query_params.get("days")
+        if days is not None:
+            try:
+                days = min(max(int(days), 1), settings.POST_VIEWS_DAILY_RETENTION_DAYS)
+            except ValueError:
+                return Response({"detail": "days must be an integer."}, status=400)
+            try:
+                data["views_unique_window"] = get_post_unique_views_window(post.pk, days)
+            except ValueError as e:
+                return Response({"detail": str(e)}, status=400)
+            data["days"] = days
+        return Response(data)
+
     @action(
         methods=["post"],
         detail=False,
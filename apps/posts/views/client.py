@@ -4,33 +4,58 @@ from django.core.cache import cache
 from django.db.models import Count, Q
 from django.http import HttpRequest
 from django_filters.rest_framework import DjangoFilterBackend
-from drf_spectacular.utils import extend_schema
+from drf_spectacular.utils import OpenApiParameter, extend_schema
 from rest_framework import status
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.filters import OrderingFilter
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.viewsets import ReadOnlyModelViewSet
 
 from apps.bookmarks.models import Bookmark
-from apps.common.pagination import PostPageNumberPagination
+from apps.common.pagination import PostFeedPagination
+from apps.common.utils.cache import get_or_compute
+from apps.common.utils.encoded_response import encode_list, encode_payload, encoded_response
+from apps.common.utils.local_cache import local_get_or_set
+from apps.common.utils.request_snapshot import build_request, snapshot_request
 from apps.favourites.models import Favourite
 from apps.posts.filters import PostFilter
 from apps.posts.models import Post, Reaction, ReactionType
 from apps.posts.serializers import (
+    PostCardSerializer,
     PostDetailSerializer,
-    PostListSerializer,
     PostReactionsSerializer,
     ReactionPutSerializer,
 )
 from apps.posts.services import get_post_views, register_post_view
+from apps.posts.services.leaderboards import WINDOWS as LEADERBOARD_WINDOWS
+from apps.posts.services.leaderboards import get_popular_post_ids
+from apps.posts.services.post_cards import get_post_cards, post_card_values
+from apps.posts.services.trending import get_trending_post_ids
+from apps.posts.tasks import refresh_client_post_cache
 from apps.posts.trigram_search import TrigramSearchFilter
 from apps.posts.utils import get_viewer_id
+from apps.posts.utils.cache_keys import (
+    canonical_list_link,
+    canonical_list_query,
+    get_or_compute_list,
+    post_detail_key,
+    post_reactions_key,
+    post_tags_key,
+    related_posts_key,
+)
 from apps.tags.serializers import TagSerializer
 from apps.users.models.user import Role, User
 
 logger = logging.getLogger(__name__)
 
+# Stale entries stay servable this long past their TTL while a Celery task rebuilds them
+LIST_STALE_TTL = 60 * 5
+DETAIL_STALE_TTL = 60 * 60
+
+TOP_POSTS_LIMIT = 10
+
 
 @extend_schema(tags=["Posts"])
 class ClientPostViewSet(ReadOnlyModelViewSet):
@@ -41,13 +66,13 @@ class ClientPostViewSet(ReadOnlyModelViewSet):
 
     search_fields = ["title", "short_description"]
     ordering_fields = ["published_at", "created_at"]
-    pagination_class = PostPageNumberPagination
+    pagination_class = PostFeedPagination
 
     def get_queryset(self):
         user = self.request.user
         base = (
             Post.objects.select_related("author", "category")
-            .prefetch_related("images", "allowed_reactions", "comments")
+            .prefetch_related("allowed_reactions")
             .order_by("-published_at")
         )
 
@@ -71,7 +96,7 @@ class ClientPostViewSet(ReadOnlyModelViewSet):
             return PostReactionsSerializer
         elif self.action == "tags":
             return TagSerializer
-        return PostListSerializer
+        return PostCardSerializer
 
     def get_permissions(self):
         if self.action in ["favourite", "bookmark", "put_reaction"]:
@@ -83,165 +108,254 @@ class ClientPostViewSet(ReadOnlyModelViewSet):
             return super().paginate_queryset(queryset)
         return None
 
+    def _get_visibility_scope(self, request):
+        """
+        Cache scope mirroring get_queryset visibility rules.
+        Anonymous and regular users only see published posts and share one entry;
+        admins share the unrestricted entry; authors also see their own drafts.
+        """
+        user = request.user
+        if user.is_anonymous:
+            return "published"
+        if user.role == Role.ADMIN:
+            return "admin"
+        if user.role == Role.AUTHOR:
+            return f"author:{user.pk}"
+        return "published"
+
     def _get_cache_key_for_list(self, request):
-        """Generate cache key for list endpoint including all filters"""
-        user_role = "anon" if request.user.is_anonymous else request.user.role
-        user_id = "anon" if request.user.is_anonymous else request.user.id
+        """
+        Generate the cache key suffix for the list endpoint including all filters.
+        The key is namespaced under the current list generation by get_or_compute_list.
+        """
+        scope = self._get_visibility_scope(request)
+
+        # Only recognized, normalized query params end up in the key
+        query_digest = canonical_list_query(request.query_params, self)
+        return f"{scope}:{query_digest}"
+
+    @classmethod
+    def for_background(cls, action_name, request_snapshot, kwargs):
+        """
+        Set up a view instance outside of the request cycle, e.g. in a Celery task.
+        """
+        view = cls()
+        view.action = action_name
+        view.args = ()
+        view.kwargs = kwargs
+        view.format_kwarg = None
+        view.request = build_request(request_snapshot)
+        return view
+
+    def _refresh_in_background(self, timeout, stale_ttl):
+        """
+        Refresh hook for get_or_compute: rebuilds a stale entry in a Celery task
+        while the current request is served the stale payload.
+        """
+
+        def refresh(cache_key):
+            refresh_client_post_cache.delay(
+                self.action,
+                cache_key,
+                timeout,
+                stale_ttl,
+                snapshot_request(self.request),
+                self.kwargs,
+            )
 
-        # Include query params in cache key
-        query_params = request.GET.urlencode()
-        return f"post_list:{user_role}:{user_id}:{query_params}"
+        return refresh
 
-    def list(self, request, *args, **kwargs):
-        cache_key = self._get_cache_key_for_list(request)
-        cached_response = cache.get(cache_key)
-
-        if cached_response:
-            logger.debug("[CACHE] Post list cache hit - key=%s", cache_key)
-            return Response(cached_response)
+    def build_payload(self):
+        """
+        Uncached, encoded payload of the current action, used by the background refresh
+        task.
+        """
+        if self.action == "retrieve":
+            instance = self.get_object()
+            return encode_payload(self._build_retrieve(instance), instance.updated_at)
+        if self.action == "list":
+            return encode_payload(self._build_list())
+        return encode_payload(self._build_top_posts())
 
-        queryset = self.filter_queryset(self.get_queryset())
+    def _build_list(self):
+        queryset = post_card_values(self.filter_queryset(self.get_queryset()))
         page = self.paginate_queryset(queryset)
 
         if page is not None:
             serializer = self.get_serializer(page, many=True)
             # Cache the entire paginated response structure
-            response = self.get_paginated_response(serializer.data)
-            cache.set(cache_key, response.data, 60 * 5)  # 5 minutes
-            logger.debug("[CACHE] Post list cached - key=%s", cache_key)
-            return response
-
-        serializer = self.get_serializer(queryset, many=True)
-        cache.set(cache_key, serializer.data, 60 * 5)
-        logger.debug("[CACHE] Post list cached - key=%s", cache_key)
-        return Response(serializer.data)
+            data = self.get_paginated_response(serializer.data).data
+            for link in ("next", "previous"):
+                if link in data:
+                    data[link] = canonical_list_link(data[link], self)
+            return data
+        return self.get_serializer(queryset, many=True).data
+
+    def _build_retrieve(self, instance):
+        data = self.get_serializer(instance).data
+        # counters change without touching updated_at; retrieve splices the live values
+        for field in Post.ENGAGEMENT_COUNTER_FIELDS:
+            data.pop(field, None)
+        return data
+
+    def _build_top_posts(self):
+        queryset = post_card_values(self.get_queryset())[:TOP_POSTS_LIMIT]
+        return self.get_serializer(queryset, many=True).data
+
+    def list(self, request, *args, **kwargs):
+        cache_key = self._get_cache_key_for_list(request)
+        timeout = 60 * 5  # 5 minutes
+
+        payload = get_or_compute_list(
+            "post_list",
+            cache_key,
+            lambda: encode_payload(self._build_list()),
+            timeout,
+            stale_ttl=LIST_STALE_TTL,
+            refresh=self._refresh_in_background(timeout, LIST_STALE_TTL),
+        )
+        return encoded_response(request, payload)
 
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
-        cache_key = f"post_detail:{instance.slug}"
-
-        # Get cached post data
-        post_data = cache.get(cache_key)
-
-        if not post_data:
-            serializer = self.get_serializer(instance)
-            post_data = serializer.data
-            cache.set(cache_key, post_data, 60 * 60 * 6)  # 6 hours
-            logger.debug("[CACHE] Post detail cached - key=%s", cache_key)
-        else:
-            logger.debug("[CACHE] Post detail cache hit - key=%s", cache_key)
+        cache_key = post_detail_key(instance.slug)
+        timeout = 60 * 60 * 6  # 6 hours
+
+        payload = local_get_or_set(
+            cache_key,
+            lambda: get_or_compute(
+                cache_key,
+                lambda: encode_payload(self._build_retrieve(instance), instance.updated_at),
+                timeout,
+                stale_ttl=DETAIL_STALE_TTL,
+                refresh=self._refresh_in_background(timeout, DETAIL_STALE_TTL),
+            ),
+        )
 
         # Handle view tracking without DB hits
         viewer_id, cookie_to_set = get_viewer_id(request)
         register_post_view(instance.pk, viewer_id)
         total, unique = get_post_views(instance.pk)
 
-        # Merge cached data with view counts
-        response_data = {**post_data, "views_total": total, "views_unique": unique}
-        response = Response(response_data)
+        # Splice view and engagement counts into the cached body. Engagement counts are
+        # part of the ETag; view counts move with every request, this one included, and
+        # are left out of it so the detail can still be revalidated.
+        counters = {field: getattr(instance, field) for field in Post.ENGAGEMENT_COUNTER_FIELDS}
+        response = encoded_response(
+            request,
+            payload,
+            extra=counters,
+            volatile={"views_total": total, "views_unique": unique},
+        )
 
         if cookie_to_set:
             response.set_cookie(
-                "viewer_id", cookie_to_set, max_age=31536000, samesite="None", secure=True
+                "viewer_id",
+                cookie_to_set,
+                max_age=31536000,
+                samesite="None",
+                secure=True,
             )
         return response
 
+    def _top_posts(self, request, namespace, timeout):
+        scope = self._get_visibility_scope(request)
+
+        payload = get_or_compute_list(
+            namespace,
+            scope,
+            lambda: encode_payload(self._build_top_posts()),
+            timeout,
+            local=True,
+            stale_ttl=LIST_STALE_TTL,
+            refresh=self._refresh_in_background(timeout, LIST_STALE_TTL),
+        )
+        return encoded_response(request, payload)
+
     @action(methods=["get"], detail=False, url_path="latest-posts")
     def latest_posts(self, request):
-        user_role = "anon" if request.user.is_anonymous else request.user.role
-        cache_key = f"latest_posts:{user_role}"
-
-        cached_data = cache.get(cache_key)
-        if cached_data:
-            logger.debug("[CACHE] Latest posts cache hit - key=%s", cache_key)
-            return Response(cached_data)
-
-        queryset = self.get_queryset()[:10]
-        serializer = self.get_serializer(queryset, many=True)
+        return self._top_posts(request, "latest_posts", 60 * 10)  # 10 minutes
+
+    def _ranked_posts(self, request, post_ids):
+        """
+        Cached cards of the ranked published posts, in rank order, joined without
+        re-rendering. Padded with the latest posts while a ranking is still short.
+        """
+        context = self.get_serializer_context()
+        cards = get_post_cards(post_ids, context)
+        ranked = [cards[post_id] for post_id in post_ids if post_id in cards][:TOP_POSTS_LIMIT]
+
+        if len(ranked) < TOP_POSTS_LIMIT:
+            latest = list(
+                Post.published.exclude(pk__in=post_ids)
+                .order_by("-published_at")
+                .values_list("pk", flat=True)[: TOP_POSTS_LIMIT - len(ranked)]
+            )
+            cards = get_post_cards(latest, context)
+            ranked += [cards[post_id] for post_id in latest if post_id in cards]
 
-        cache.set(cache_key, serializer.data, 60 * 10)  # 10 minutes
-        logger.debug("[CACHE] Latest posts cached - key=%s", cache_key)
-        return Response(serializer.data)
+        return encoded_response(request, encode_list(ranked))
 
     @action(methods=["get"], detail=False, url_path="trending-posts")
     def trending_posts(self, request):
-        user_role = "anon" if request.user.is_anonymous else request.user.role
-        cache_key = f"trending_posts:{user_role}"
-
-        cached_data = cache.get(cache_key)
-        if cached_data:
-            logger.debug("[CACHE] Trending posts cache hit - key=%s", cache_key)
-            return Response(cached_data)
-
-        queryset = self.get_queryset()[:10]
-        serializer = self.get_serializer(queryset, many=True)
-
-        cache.set(cache_key, serializer.data, 60 * 15)  # 15 minutes
-        logger.debug("[CACHE] Trending posts cached - key=%s", cache_key)
-        return Response(serializer.data)
-
+        """
+        Published posts ranked by time-decayed engagement, see services.trending.
+        """
+        # a few spares in case some of the top posts are no longer published
+        return self._ranked_posts(request, get_trending_post_ids(TOP_POSTS_LIMIT * 2))
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter("window", str, enum=LEADERBOARD_WINDOWS, description="Defaults to all")
+        ]
+    )
     @action(methods=["get"], detail=False, url_path="most-popular-posts")
     def most_popular_posts(self, request):
-        user_role = "anon" if request.user.is_anonymous else request.user.role
-        cache_key = f"most_popular_posts:{user_role}"
-
-        cached_data = cache.get(cache_key)
-        if cached_data:
-            logger.debug("[CACHE] Most popular posts cache hit - key=%s", cache_key)
-            return Response(cached_data)
-
-        queryset = self.get_queryset()[:10]
-        serializer = self.get_serializer(queryset, many=True)
-
-        cache.set(cache_key, serializer.data, 60 * 20)  # 20 minutes
-        logger.debug("[CACHE] Most popular posts cached - key=%s", cache_key)
-        return Response(serializer.data)
+        """
+        Published posts ranked by accumulated engagement over `window`
+        (day, week, month or all), see services.leaderboards.
+        """
+        window = request.query_params.get("window", "all")
+        if window not in LEADERBOARD_WINDOWS:
+            raise ValidationError(
+                {"window": [f"Must be one of: {', '.join(LEADERBOARD_WINDOWS)}."]}
+            )
+        return self._ranked_posts(request, get_popular_post_ids(window, TOP_POSTS_LIMIT * 2))
 
     @action(methods=["get"], detail=False, url_path="homepage-statistics")
     def homepage_statistics(self, request):
-        cache_key = "homepage_statistics"
-
-        cached_data = cache.get(cache_key)
-        if cached_data:
-            logger.debug("[CACHE] Homepage statistics cache hit - key=%s", cache_key)
-            return Response(cached_data)
-
-        articles = Post.objects.aggregate(
-            articles=Count("id", filter=Q(status=Post.Status.PUBLISHED)),
-        )["articles"]
-        writers = User.objects.aggregate(
-            writers=Count("id", filter=Q(role=Role.AUTHOR), distinct=True)
-        )["writers"]
-
-        data = {"Active Readers": "50000", "Articles": articles, "Writers": writers}
+        def compute():
+            articles = Post.objects.aggregate(
+                articles=Count("id", filter=Q(status=Post.Status.PUBLISHED)),
+            )["articles"]
+            writers = User.objects.aggregate(
+                writers=Count("id", filter=Q(role=Role.AUTHOR), distinct=True)
+            )["writers"]
+            logger.debug("[CACHE] Homepage statistics cached")
+            return encode_payload(
+                {"Active Readers": "50000", "Articles": articles, "Writers": writers}
+            )
 
-        cache.set(cache_key, data, 60 * 30)  # 30 minutes
-        logger.debug("[CACHE] Homepage statistics cached - key=%s", cache_key)
-        return Response(data)
+        timeout = 60 * 30  # 30 minutes
+        payload = get_or_compute_list("homepage_statistics", "all", compute, timeout)
+        return encoded_response(request, payload)
 
     @action(methods=["get"], detail=True, url_path="related-posts")
     def related_posts(self, request, slug=None):
         post: Post = self.get_object()
-        cache_key = f"related_posts:{post.slug}"
-
-        cached_data = cache.get(cache_key)
-        if cached_data:
-            logger.debug("[CACHE] Related posts cache hit - key=%s", cache_key)
-            return Response(cached_data)
-
-        if not post.category:
-            return Post.objects.none()
-        qs = (
-            post.category.posts.all()
-            .exclude(slug=post.slug)
-            .select_related("author", "category")
-            .order_by("-published_at")[:3]
-        )
-        serializer = self.get_serializer(qs, many=True)
+        cache_key = related_posts_key(post.slug)
 
-        cache.set(cache_key, serializer.data, 60 * 60)  # 1 hour
-        logger.debug("[CACHE] Related posts cached - key=%s", cache_key)
-        return Response(serializer.data)
+        def compute():
+            if not post.category:
+                return encode_payload([])
+            qs = post_card_values(
+                post.category.posts.exclude(slug=post.slug).order_by("-published_at")
+            )[:3]
+            logger.debug("[CACHE] Related posts cached - key=%s", cache_key)
+            return encode_payload(self.get_serializer(qs, many=True).data)
+
+        payload = get_or_compute(cache_key, compute, 60 * 60)  # 1 hour
+        return encoded_response(request, payload)
 
     @action(methods=["post"], detail=True)
     def favourite(self, request: HttpRequest, slug=None):
@@ -309,9 +423,9 @@ class ClientPostViewSet(ReadOnlyModelViewSet):
         reaction = serializer.save()
 
         # Invalidate reaction cache for this post
-        cache_keys = [f"post_reactions:{post.slug}:anon"]
+        cache_keys = [post_reactions_key(post.slug, "anon")]
         if request.user.is_authenticated:
-            cache_keys.append(f"post_reactions:{post.slug}:{request.user.id}")
+            cache_keys.append(post_reactions_key(post.slug, request.user.id))
         cache.delete_many(cache_keys)
         logger.info(
             "[CACHE] Reaction cache invalidated - post_id=%s, slug=%s, keys=%s",
@@ -347,7 +461,11 @@ class ClientPostViewSet(ReadOnlyModelViewSet):
         out = PostReactionsSerializer(
             qs,
             many=True,
-            context={"request": request, "post": post, "user_reactions": user_reaction_ids},
+            context={
+                "request": request,
+                "post": post,
+                "user_reactions": user_reaction_ids,
+            },
         )
         return Response(out.data, status=status.HTTP_201_CREATED)
 
@@ -357,9 +475,9 @@ class ClientPostViewSet(ReadOnlyModelViewSet):
         deleted_count, _ = Reaction.objects.filter(user=request.user, post=post).delete()
 
         # Invalidate reaction cache for this post
-        cache_keys = [f"post_reactions:{post.slug}:anon"]
+        cache_keys = [post_reactions_key(post.slug, "anon")]
         if request.user.is_authenticated:
-            cache_keys.append(f"post_reactions:{post.slug}:{request.user.id}")
+            cache_keys.append(post_reactions_key(post.slug, request.user.id))
         cache.delete_many(cache_keys)
         logger.info(
             "[CACHE] Reaction cache invalidated - post_id=%s, slug=%s, keys=%s",
@@ -385,7 +503,9 @@ class ClientPostViewSet(ReadOnlyModelViewSet):
 
         # No user reactions after deletion
         serializer = self.get_serializer(
-            qs, many=True, context={"request": request, "post": post, "user_reactions": set()}
+            qs,
+            many=True,
+            context={"request": request, "post": post, "user_reactions": set()},
         )
         return Response(serializer.data)
 
@@ -393,54 +513,55 @@ class ClientPostViewSet(ReadOnlyModelViewSet):
     def list_reactions(self, request, slug=None):
         post: Post = self.get_object()
         user_id = request.user.id if request.user.is_authenticated else "anon"
-        cache_key = f"post_reactions:{post.slug}:{user_id}"
-
-        cached_data = cache.get(cache_key)
-        if cached_data:
-            logger.debug("[CACHE] Post reactions cache hit - key=%s", cache_key)
-            return Response(cached_data)
-
-        # Get allowed reactions for this post
-        if post.allowed_reactions.exists():
-            qs = post.allowed_reactions.all()
-        else:
-            # If no specific reactions are set, no reactions allowed
-            qs = ReactionType.objects.none()
-
-        qs = qs.annotate(count=Count("reactions", filter=Q(reactions__post=post))).order_by("id")
+        cache_key = post_reactions_key(post.slug, user_id)
+
+        def compute():
+            # Get allowed reactions for this post
+            if post.allowed_reactions.exists():
+                qs = post.allowed_reactions.all()
+            else:
+                # If no specific reactions are set, no reactions allowed
+                qs = ReactionType.objects.none()
+
+            qs = qs.annotate(count=Count("reactions", filter=Q(reactions__post=post))).order_by(
+                "id"
+            )
 
-        # Prefetch user's reactions once to avoid N+1
-        user_reaction_ids = set()
-        if request.user.is_authenticated:
-            user_reaction_ids = set(
-                Reaction.objects.filter(user=request.user, post=post).values_list(
-                    "type_id", flat=True
+            # Prefetch user's reactions once to avoid N+1
+            user_reaction_ids = set()
+            if request.user.is_authenticated:
+                user_reaction_ids = set(
+                    Reaction.objects.filter(user=request.user, post=post).values_list(
+                        "type_id", flat=True
+                    )
                 )
-            )
 
-        serializer = self.get_serializer(
-            qs,
-            many=True,
-            context={"request": request, "post": post, "user_reactions": user_reaction_ids},
-        )
+            serializer = self.get_serializer(
+                qs,
+                many=True,
+                context={
+                    "request": request,
+                    "post": post,
+                    "user_reactions": user_reaction_ids,
+                },
+            )
+            logger.debug("[CACHE] Post reactions cached - key=%s", cache_key)
+            return encode_payload(serializer.data)
 
-        cache.set(cache_key, serializer.data, 60 * 5)  # 5 minutes
-        logger.debug("[CACHE] Post reactions cached - key=%s", cache_key)
-        return Response(serializer.data)
+        payload = get_or_compute(cache_key, compute, 60 * 5)  # 5 minutes
+        return encoded_response(request, payload)
 
     @action(methods=["get"], detail=True)
     def tags(self, request, slug=None):
         post: Post = self.get_object()
-        cache_key = f"post_tags:{post.slug}"
-
-        cached_data = cache.get(cache_key)
-        if cached_data:
-            logger.debug("[CACHE] Post tags cache hit - key=%s", cache_key)
-            return Response(cached_data)
+        cache_key = post_tags_key(post.slug)
 
-        tags = post.tags.all()
-        serializer = self.get_serializer(tags, many=True)
+        def compute():
+            logger.debug("[CACHE] Post tags cached - key=%s", cache_key)
+            return encode_payload(self.get_serializer(post.tags.all(), many=True).data)
 
-        cache.set(cache_key, serializer.data, 60 * 60 * 24)  # 24 hours
-        logger.debug("[CACHE] Post tags cached - key=%s", cache_key)
-        return Response(serializer.data)
+        payload = local_get_or_set(
+            cache_key,
+            lambda: get_or_compute(cache_key, compute, 60 * 60 * 24),  # 24 hours
+        )
+        return encoded_response(request, payload)
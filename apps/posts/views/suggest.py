@@ -0,0 +1,64 @@
+import logging
+
+from django.core.cache import cache
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.viewsets import ViewSet
+
+from apps.posts.serializers import PostSuggestionSerializer
+from apps.posts.services.suggestions import suggest, suggestions_ready
+from apps.posts.tasks import rebuild_suggestion_index
+
+logger = logging.getLogger(__name__)
+
+SUGGEST_DEFAULT_LIMIT = 8
+SUGGEST_MAX_LIMIT = 20
+REBUILD_MARKER_KEY = "suggest:rebuild_scheduled"
+REBUILD_MARKER_TIMEOUT = 60 * 10
+
+
+@extend_schema(tags=["Posts"])
+class PostSuggestViewSet(ViewSet):
+    """
+    Typeahead over published post titles, tags, categories and author names, answered
+    from the Redis prefix index in services.suggestions without touching the database.
+    """
+
+    permission_classes = [AllowAny]
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter("q", str, description="Prefix typed so far"),
+            OpenApiParameter(
+                "limit",
+                int,
+                description=f"Number of suggestions, at most {SUGGEST_MAX_LIMIT}",
+                default=SUGGEST_DEFAULT_LIMIT,
+            ),
+        ],
+        responses=PostSuggestionSerializer(many=True),
+    )
+    def list(self, request):
+        try:
+            limit = int(request.query_params.get("limit", SUGGEST_DEFAULT_LIMIT))
+        except (TypeError, ValueError):
+            limit = SUGGEST_DEFAULT_LIMIT
+        limit = min(max(limit, 1), SUGGEST_MAX_LIMIT)
+
+        results = suggest(request.query_params.get("q", ""), limit)
+        if not results and not suggestions_ready():
+            self._schedule_rebuild()
+        return Response(results)
+
+    @staticmethod
+    def _schedule_rebuild():
+        # e.g. after a Redis flush; at most one rebuild is queued per marker lifetime
+        if not cache.add(REBUILD_MARKER_KEY, 1, REBUILD_MARKER_TIMEOUT):
+            return
+        logger.info("[SUGGEST] Suggestion index missing, scheduling rebuild")
+        try:
+            rebuild_suggestion_index.delay()
+        except Exception as e:
+            cache.delete(REBUILD_MARKER_KEY)
+            logger.warning("[SUGGEST] Failed to schedule suggestion rebuild: %s", str(e))
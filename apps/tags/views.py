@@ -1,4 +1,5 @@
 import logging
+from functools import partial
 
 from drf_spectacular.utils import extend_schema
 from rest_framework import viewsets
@@ -7,7 +8,14 @@ from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
 from apps.common.permissions.base import IsAdmin, IsAuthorOrAdmin
-from apps.posts.serializers import PostListSerializer
+from apps.common.utils.conditional import (
+    conditional_response,
+    instance_validators,
+    queryset_validators,
+)
+from apps.posts.models import Post
+from apps.posts.serializers import PostCardSerializer
+from apps.posts.services.post_cards import post_card_values
 from apps.tags.models import Tag
 from apps.tags.serializers import TagSerializer
 
@@ -27,9 +35,21 @@ class TagViewSet(viewsets.ModelViewSet):
 
     def get_serializer_class(self):
         if self.action == "posts":
-            return PostListSerializer
+            return PostCardSerializer
         return TagSerializer
 
+    def list(self, request, *args, **kwargs):
+        etag, last_modified = queryset_validators(self.get_queryset(), request.accepted_media_type)
+        build = partial(super().list, request, *args, **kwargs)
+        return conditional_response(request, build, etag, last_modified)
+
+    def retrieve(self, request, *args, **kwargs):
+        tag: Tag = self.get_object()
+        etag, last_modified = instance_validators(tag, request.accepted_media_type)
+        return conditional_response(
+            request, lambda: Response(self.get_serializer(tag).data), etag, last_modified
+        )
+
     def perform_create(self, serializer):
         instance = serializer.save()
         logger.info("[TAG] Tag created - tag_id=%s, name=%s", instance.pk, instance.name)
@@ -47,6 +67,15 @@ class TagViewSet(viewsets.ModelViewSet):
     @action(methods=["get"], detail=True, url_path="posts")
     def posts(self, request, pk=None):
         tag: Tag = self.get_object()
-        qs = tag.posts.all().select_related("category", "author").prefetch_related("tags", "images")
-        serializer = self.get_serializer(qs, many=True)
-        return Response(serializer.data)
+        qs = tag.posts.all()
+
+        # post cards carry no tag fields: only the posts and their counters matter
+        etag, last_modified = queryset_validators(
+            qs, request.accepted_media_type, counter_fields=Post.ENGAGEMENT_COUNTER_FIELDS
+        )
+        return conditional_response(
+            request,
+            lambda: Response(self.get_serializer(post_card_values(qs), many=True).data),
+            etag,
+            last_modified,
+        )
@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 from datetime import timedelta
 from pathlib import Path
+from celery.schedules import crontab
 from decouple import config
 import os
 
@@ -318,9 +319,37 @@ CELERY_TASK_SEND_SENT_EVENT = False
 CELERY_BEAT_SCHEDULER = "django_celery_beat.schedulers.DatabaseScheduler"
 
 CELERY_BEAT_SCHEDULE = {
-
+    "flush-post-view-counters": {
+        "task": "apps.analytics.tasks.flush_post_view_counters",
+        "schedule": timedelta(minutes=1),
+    },
+    "rebase-trending-scores": {
+        "task": "apps.posts.tasks.rebase_trending_scores",
+        "schedule": timedelta(hours=6),
+    },
+    "rollover-popularity-leaderboards": {
+        "task": "apps.posts.tasks.rollover_popularity_leaderboards",
+        "schedule": crontab(hour=0, minute=1),
+    },
+    "maintain-log-partitions": {
+        "task": "apps.logs.tasks.maintain_log_partitions",
+        "schedule": timedelta(hours=6),
+    },
+    "reconcile-unread-notification-counts": {
+        "task": "apps.notifications.tasks.reconcile_unread_notification_counts",
+        "schedule": timedelta(minutes=15),
+    },
 }
 
+# LogEntry rows are kept this many days; older daily partitions are dropped.
+LOG_RETENTION_DAYS = config("LOG_RETENTION_DAYS", default=30, cast=int)
+
+# Unique post views: "set" keeps every viewer id (exact, memory grows with readers),
+# "hll" uses HyperLogLog (~12 KB per post, ~0.81% error) plus per-day shards.
+# Convert existing sets with `python manage.py migrate_unique_views` before switching.
+POST_VIEWS_UNIQUE_BACKEND = config("POST_VIEWS_UNIQUE_BACKEND", default="set")
+POST_VIEWS_DAILY_RETENTION_DAYS = config("POST_VIEWS_DAILY_RETENTION_DAYS", default=90, cast=int)
+
 SILKY_IGNORE_PATHS = [
     r'^static/',
     r'^media/',
@@ -359,11 +388,34 @@ LOGGING = {
         },
     },
 
+    # Hot-path INFO lines are sampled and rate-limited before they reach the file and the
+    # database; suppressed ones are summarized every `summary_interval` seconds.
+    # WARNING and above always pass.
+    "filters": {
+        "sampling": {
+            "()": "apps.logs.filters.SamplingFilter",
+            "rules": [
+                # cache invalidation and fill lines, several per post save
+                {"prefix": "[CACHE]", "sample_rate": 0.01, "rate": 5},
+                # per-request engagement lines
+                {"prefix": "[REACTION]", "rate": 10, "burst": 50},
+                {"prefix": "[BOOKMARK]", "rate": 10, "burst": 50},
+                {"prefix": "[FAVOURITE]", "rate": 10, "burst": 50},
+            ],
+            "summary_interval": 60.0,
+        },
+    },
+
     "handlers": {
         "db": {
             "level": "INFO",
             "class": "apps.logs.handlers.DatabaseHandler",
             "formatter": "verbose",
+            "filters": ["sampling"],
+            # records are queued and bulk-inserted by a background thread
+            "capacity": 10_000,
+            "batch_size": 200,
+            "flush_interval": 2.0,
         },
 
         "file": {
@@ -371,6 +423,7 @@ LOGGING = {
             "class": "logging.FileHandler",
             "filename": os.path.join(BASE_DIR, "app.log"),
             "formatter": "verbose",
+            "filters": ["sampling"],
         },
 
         "console": {